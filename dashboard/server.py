@@ -2,71 +2,466 @@
 """
 Simple HTTP server for local development to avoid CORS issues
 Enhanced with RSS feed proxy support
+
+aiohttp가 설치되어 있으면 asyncio 기반 서버로 실행되어 RSS 프록시 요청이
+서로를 막지 않습니다. 설치되어 있지 않으면 표준 라이브러리 서버로 대체합니다.
 """
+import argparse
+import asyncio
 import http.server
-import socketserver
+import io
+import multiprocessing
 import os
+import platform
+import socket
 import sys
-import urllib.request
+import threading
+import time
 import urllib.parse
+import zlib
 import json
+from collections import OrderedDict
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from aiohttp import web
+    import aiohttp
+except ImportError:  # aiohttp 미설치 시 동기 서버 사용
+    aiohttp = None
+    web = None
+
 PORT = 8090
+PROXY_TIMEOUT = 15
+STREAM_CHUNK_SIZE = 64 * 1024
+MAX_PROXY_FETCHES = 32
+
+# RSS 피드 호스트와의 연결(keep-alive)을 재사용하기 위한 공유 세션
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=100, pool_maxsize=100)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+# 압축된 본문을 풀지 않고 그대로 브라우저에 전달하므로 브라우저가 처리할 수 있는 인코딩만 요청
+UPSTREAM_ACCEPT_ENCODING = 'gzip, deflate'
+SESSION.headers['Accept-Encoding'] = UPSTREAM_ACCEPT_ENCODING
+# 클라이언트가 받지 못하는 업스트림 압축을 풀 때의 zlib wbits (UPSTREAM_ACCEPT_ENCODING과 대응)
+DECOMPRESS_WBITS = {'gzip': 16 + zlib.MAX_WBITS, 'deflate': zlib.MAX_WBITS}
+# 동기 서버에서 동시에 진행되는 업스트림 요청 수 제한
+PROXY_SLOTS = threading.BoundedSemaphore(MAX_PROXY_FETCHES)
+
+# 프록시를 허용할 RSS 피드 호스트 (대시보드에서 사용하는 피드만 허용해 열린 프록시가 되지 않도록 함)
+ALLOWED_FEED_HOSTS = frozenset({
+    'news.google.com',
+    'feeds.bloomberg.com',
+    'www.cnbc.com',
+    'feeds.finance.yahoo.com',
+    'feeds.reuters.com',
+})
+ALLOWED_FEED_SCHEMES = frozenset({'http', 'https'})
+
+
+def is_allowed_feed(url):
+    parts = urllib.parse.urlsplit(url)
+    return parts.scheme in ALLOWED_FEED_SCHEMES and parts.hostname in ALLOWED_FEED_HOSTS
+
+
+# 피드 URL -> (저장 시각, ETag, Last-Modified, 본문, Content-Encoding).
+# 변경되지 않은 피드는 304로 재검증만 수행.
+# 허용된 호스트라도 쿼리 문자열만 바꾼 URL로 메모리가 계속 늘지 않도록
+# 항목 수(LRU)와 유효 기간으로 제한
+FEED_CACHE_MAX_ENTRIES = 64
+FEED_CACHE_TTL = 60 * 60
+FEED_CACHE = OrderedDict()
+FEED_CACHE_LOCK = threading.Lock()
+
+
+def cached_feed(url):
+    """유효 기간 내의 캐시된 피드 (ETag, Last-Modified, 본문, Content-Encoding) 또는 None"""
+    with FEED_CACHE_LOCK:
+        entry = FEED_CACHE.get(url)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= FEED_CACHE_TTL:
+            del FEED_CACHE[url]
+            return None
+        FEED_CACHE.move_to_end(url)
+        return entry[1:]
+
+
+def revalidation_headers(cached):
+    """캐시된 피드가 있으면 조건부 요청 헤더를 만듭니다."""
+    if cached is None:
+        return {}
+    etag, last_modified = cached[:2]
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def is_revalidatable(headers):
+    return 'ETag' in headers or 'Last-Modified' in headers
+
+
+def store_feed(url, headers, body, decoded=False):
+    entry = (
+        time.monotonic(),
+        headers.get('ETag'),
+        headers.get('Last-Modified'),
+        body,
+        None if decoded else headers.get('Content-Encoding'),
+    )
+    with FEED_CACHE_LOCK:
+        FEED_CACHE[url] = entry
+        FEED_CACHE.move_to_end(url)
+        while len(FEED_CACHE) > FEED_CACHE_MAX_ENTRIES:
+            FEED_CACHE.popitem(last=False)
+
+
+def must_decode(accept_encoding, encoding):
+    """업스트림 압축을 클라이언트가 받지 못해 풀어서 보내야 하는지 (Accept-Encoding 기준)"""
+    encoding = (encoding or '').strip().lower()
+    if encoding not in DECOMPRESS_WBITS:
+        return False  # 압축 없음 (풀 수 없는 인코딩은 그대로 전달)
+    for part in (accept_encoding or '').lower().split(','):
+        name, _, params = part.partition(';')
+        if name.strip() not in (encoding, '*'):
+            continue
+        qvalue = params.strip()
+        if qvalue.startswith('q='):
+            try:
+                return float(qvalue[2:]) == 0
+            except ValueError:
+                return True
+        return False
+    return True
+
+
+def decompressor(encoding):
+    return zlib.decompressobj(DECOMPRESS_WBITS[encoding.strip().lower()])
+
+
+def passthrough_headers(headers, decoded=False):
+    """업스트림 본문을 전달할 때 함께 보낼 헤더 (압축을 풀어 보내면 인코딩/길이 헤더 제외)"""
+    forwarded = {'Content-Type': 'application/xml', 'Vary': 'Accept-Encoding'}
+    if decoded:
+        return forwarded
+    if headers.get('Content-Encoding'):
+        forwarded['Content-Encoding'] = headers['Content-Encoding']
+    if headers.get('Content-Length'):
+        forwarded['Content-Length'] = headers['Content-Length']
+    return forwarded
+
+
+def cached_feed_response(cached, accept_encoding):
+    """캐시된 피드의 (본문, 헤더). 클라이언트가 받지 못하는 압축이면 풀어서 반환"""
+    _, _, body, encoding = cached
+    if must_decode(accept_encoding, encoding):
+        decoder = decompressor(encoding)
+        body, encoding = decoder.decompress(body) + decoder.flush(), None
+    return body, passthrough_headers({'Content-Encoding': encoding, 'Content-Length': str(len(body))})
+
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+}
+# 동기 서버는 매 응답마다 send_header를 세 번 호출하는 대신 미리 인코딩한 블록을 붙임
+CORS_HEADER_BYTES = ''.join(
+    f'{name}: {value}\r\n' for name, value in CORS_HEADERS.items()
+).encode('latin-1')
+
 
 class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def end_headers(self):
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        # HTTP/0.9 요청에는 헤더 버퍼가 없음 (send_header와 동일한 조건)
+        if hasattr(self, '_headers_buffer'):
+            self._headers_buffer.append(CORS_HEADER_BYTES)
         super().end_headers()
 
     def do_OPTIONS(self):
         self.send_response(200)
         self.end_headers()
 
+    def copyfile(self, source, outputfile):
+        # 정적 파일은 sendfile로 페이지 캐시에서 소켓으로 바로 전송 (사용자 공간 복사 없음)
+        try:
+            out_fd = outputfile.fileno()
+            in_fd = source.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return super().copyfile(source, outputfile)
+        if not hasattr(os, 'sendfile'):
+            return super().copyfile(source, outputfile)
+
+        offset = source.tell()
+        size = os.fstat(in_fd).st_size
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # sendfile을 지원하지 않는 파일 시스템 등: 남은 부분은 일반 복사로 전송
+            source.seek(offset)
+            super().copyfile(source, outputfile)
+
+    def proxy_rss(self, url):
+        cached = cached_feed(url)
+        with SESSION.get(url, headers=revalidation_headers(cached),
+                         timeout=PROXY_TIMEOUT, stream=True) as response:
+            accept_encoding = self.headers.get('Accept-Encoding')
+            if response.status_code == 304 and cached is not None:
+                body, headers = cached_feed_response(cached, accept_encoding)
+                self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.proxy_headers_sent = True
+                self.wfile.write(body)
+                return
+            response.raise_for_status()
+
+            # 본문을 청크 단위로 바로 전달 (클라이언트가 받을 수 있으면 압축된 상태 그대로)하고,
+            # 재검증 가능한 피드만 캐시용으로 보관
+            decode = must_decode(accept_encoding, response.headers.get('Content-Encoding'))
+            self.send_response(200)
+            for name, value in passthrough_headers(response.headers, decode).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.proxy_headers_sent = True
+            chunks = [] if is_revalidatable(response.headers) else None
+            for chunk in response.raw.stream(STREAM_CHUNK_SIZE, decode_content=decode):
+                if chunks is not None:
+                    chunks.append(chunk)
+                self.wfile.write(chunk)
+            if chunks is not None:
+                store_feed(url, response.headers, b''.join(chunks), decode)
+
     def do_GET(self):
         # Handle RSS proxy requests
-        if self.path.startswith('/proxy/rss?'):
+        request_url = urllib.parse.urlsplit(self.path)
+        if request_url.path == '/proxy/rss':
+            self.proxy_headers_sent = False
             try:
                 # Parse the query parameters
-                query_string = self.path.split('?', 1)[1]
-                params = urllib.parse.parse_qs(query_string)
-                url = params.get('url', [''])[0]
-                
+                try:
+                    params = dict(urllib.parse.parse_qsl(request_url.query, max_num_fields=4))
+                except ValueError:  # 쿼리 필드가 너무 많음
+                    self.send_error(400, "Too many query parameters")
+                    return
+                url = params.get('url', '')
+
                 if not url:
                     self.send_error(400, "Missing URL parameter")
                     return
-                
-                # Fetch the RSS feed
-                with urllib.request.urlopen(url) as response:
-                    content = response.read().decode('utf-8')
-                
-                # Send the response
-                self.send_response(200)
-                self.send_header('Content-type', 'application/xml')
-                self.end_headers()
-                self.wfile.write(content.encode('utf-8'))
-                
+                if not is_allowed_feed(url):
+                    self.send_error(403, "Feed host not allowed")
+                    return
+
+                with PROXY_SLOTS:
+                    self.proxy_rss(url)
+
             except Exception as e:
                 print(f"RSS Proxy Error: {e}")
-                self.send_error(500, f"Proxy error: {str(e)}")
+                if self.proxy_headers_sent:
+                    # 상태 줄과 본문 일부를 이미 보냈으므로 오류 응답을 덧붙이지 않고 연결을 끊음
+                    self.close_connection = True
+                else:
+                    self.send_error(500, f"Proxy error: {str(e)}")
         else:
             # Handle regular file serving
             super().do_GET()
 
+
+# ---------------------------------------------------------------------------
+# asyncio (aiohttp) server
+# ---------------------------------------------------------------------------
+
+if web is not None:
+
+    @web.middleware
+    async def cors_middleware(request, handler):
+        if request.method == 'OPTIONS':
+            response = web.Response(status=200)
+        else:
+            try:
+                response = await handler(request)
+            except web.HTTPException as exc:
+                # 400/403 등 예외로 만든 응답에도 CORS 헤더를 붙여 대시보드 JS가 오류를 볼 수 있게 함
+                exc.headers.update(CORS_HEADERS)
+                raise
+        response.headers.update(CORS_HEADERS)
+        return response
+
+    async def proxy_rss(request):
+        url = request.query.get('url', '')
+        if not url:
+            raise web.HTTPBadRequest(text="Missing URL parameter")
+        if not is_allowed_feed(url):
+            raise web.HTTPForbidden(text="Feed host not allowed")
+
+        session = request.app['client_session']
+        cached = cached_feed(url)
+        response = None
+        try:
+            async with session.get(url, headers=revalidation_headers(cached)) as upstream:
+                accept_encoding = request.headers.get('Accept-Encoding')
+                if upstream.status == 304 and cached is not None:
+                    body, headers = cached_feed_response(cached, accept_encoding)
+                    return web.Response(body=body, headers=headers)
+                upstream.raise_for_status()
+
+                encoding = upstream.headers.get('Content-Encoding')
+                decoder = decompressor(encoding) if must_decode(accept_encoding, encoding) else None
+                response = web.StreamResponse(
+                    status=200, headers=passthrough_headers(upstream.headers, decoder is not None))
+                await response.prepare(request)
+                chunks = [] if is_revalidatable(upstream.headers) else None
+                async for chunk in upstream.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    if decoder is not None:
+                        chunk = decoder.decompress(chunk)
+                    if chunks is not None:
+                        chunks.append(chunk)
+                    await response.write(chunk)
+                if decoder is not None:
+                    tail = decoder.flush()
+                    if chunks is not None:
+                        chunks.append(tail)
+                    await response.write(tail)
+                await response.write_eof()
+                if chunks is not None:
+                    store_feed(url, upstream.headers, b''.join(chunks), decoder is not None)
+                return response
+        except aiohttp.ClientError as e:
+            print(f"RSS Proxy Error: {e}")
+            if response is not None and response.prepared:
+                # 이미 보낸 응답에 오류 응답을 쓸 수 없으므로 그대로 전파해 aiohttp가 연결을 끊게 함
+                raise
+            raise web.HTTPInternalServerError(text=f"Proxy error: {str(e)}")
+
+    async def index(request):
+        return web.FileResponse(request.app['root'] / 'index.html')
+
+    async def _open_client_session(app):
+        app['client_session'] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=20),
+            timeout=aiohttp.ClientTimeout(total=PROXY_TIMEOUT),
+            headers={'Accept-Encoding': UPSTREAM_ACCEPT_ENCODING},
+            auto_decompress=False,
+        )
+
+    async def _close_client_session(app):
+        await app['client_session'].close()
+
+    def create_app(root):
+        app = web.Application(middlewares=[cors_middleware])
+        app['root'] = root
+        app.on_startup.append(_open_client_session)
+        app.on_cleanup.append(_close_client_session)
+        app.router.add_get('/proxy/rss', proxy_rss)
+        app.router.add_get('/', index)
+        app.router.add_static('/', root, show_index=True)
+        return app
+
+
+def install_event_loop_policy():
+    """리눅스에서는 io_uring(uringcore) → uvloop 순으로 이벤트 루프를 교체합니다."""
+    if not sys.platform.startswith('linux'):
+        return 'asyncio'
+
+    # io_uring은 커널 5.1+에서 지원되지만 안정적인 사용은 5.11 이상을 권장
+    kernel = tuple(int(p) for p in platform.release().split('-')[0].split('.')[:2] if p.isdigit())
+    if kernel >= (5, 11):
+        try:
+            import uringcore
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return 'uringcore'
+        except ImportError:
+            pass
+
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return 'uvloop'
+    except ImportError:
+        return 'asyncio'
+
+
+class ThreadedServer(http.server.ThreadingHTTPServer):
+    allow_reuse_address = True
+    # 단일 프로세스에서는 SO_REUSEPORT를 켜지 않아 포트가 이미 사용 중이면 바로 실패
+    allow_reuse_port = False
+
+    def server_bind(self):
+        # Python 3.10 이하에는 allow_reuse_port가 없으므로 직접 설정
+        if (self.allow_reuse_port and sys.version_info < (3, 11)
+                and hasattr(socket, 'SO_REUSEPORT')):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+class SharedPortServer(ThreadedServer):
+    # 여러 워커 프로세스가 같은 포트를 바인딩하면 커널이 accept()를 분산
+    allow_reuse_port = True
+
+
+def run_sync_server(reuse_port=False):
+    server_class = SharedPortServer if reuse_port else ThreadedServer
+    with server_class(("", PORT), CORSHTTPRequestHandler) as httpd:
+        httpd.serve_forever()
+
+
+def serve(dashboard_dir, reuse_port=False):
+    """reuse_port는 워커가 여러 개일 때만 켬 (실수로 띄운 두 번째 서버가 포트를 나눠 갖지 않도록)"""
+    if web is not None:
+        install_event_loop_policy()
+        web.run_app(create_app(dashboard_dir), port=PORT, reuse_port=reuse_port, print=None)
+    else:
+        run_sync_server(reuse_port)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="대시보드 개발 서버")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="같은 포트를 공유하는 워커 프로세스 수 (0이면 CPU 코어 수)",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    workers = args.workers or os.cpu_count() or 1
+
     # Change to dashboard directory
     dashboard_dir = Path(__file__).parent.absolute()
     os.chdir(dashboard_dir)
-    
+
     try:
-        with socketserver.TCPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
-            print(f"서버가 포트 {PORT}에서 시작되었습니다.")
-            print(f"브라우저에서 http://localhost:{PORT} 접속하세요.")
-            print(f"현재 디렉토리: {dashboard_dir}")
-            print("Ctrl+C로 서버를 종료할 수 있습니다.")
-            httpd.serve_forever()
+        print(f"서버가 포트 {PORT}에서 시작되었습니다.")
+        print(f"브라우저에서 http://localhost:{PORT} 접속하세요.")
+        print(f"현재 디렉토리: {dashboard_dir}")
+        print("Ctrl+C로 서버를 종료할 수 있습니다.")
+        if web is None:
+            print("aiohttp가 없어 표준 라이브러리 서버로 실행합니다.")
+        if workers == 1:
+            serve(dashboard_dir)
+        else:
+            print(f"워커 프로세스 {workers}개로 실행합니다.")
+            processes = [
+                multiprocessing.Process(target=serve, args=(dashboard_dir, True), daemon=True)
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
     except KeyboardInterrupt:
         print("\n서버가 종료되었습니다.")
         sys.exit(0)
@@ -75,4 +470,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,13 +1,51 @@
+import hashlib
+import json
 import os
-import google.generativeai as genai
+import sys
+from datetime import date
+from pathlib import Path
+
+CACHE_DIR = Path(".cache/genai")
+
+
+def cache_path(api_key):
+    # API 키 원문은 남기지 않고 해시 앞부분 + 날짜로 하루 단위 캐시
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:12]
+    return CACHE_DIR / f"models_{key_hash}_{date.today().isoformat()}.json"
+
+
+def fetch_models(api_key):
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return [(m.name, list(m.supported_generation_methods)) for m in genai.list_models()]
+
+
+def load_models(api_key, offline=False):
+    path = cache_path(api_key)
+    if path.exists():
+        with open(path, "r") as f:
+            return json.load(f)
+    if offline:
+        return None
+
+    models = fetch_models(api_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(models, f)
+    return models
+
 
 api_key = os.environ.get("GOOGLE_API_KEY")
 if not api_key:
     print("GOOGLE_API_KEY environment variable not set.")
 else:
-    genai.configure(api_key=api_key)
-    print("Available Models and their Supported Generation Methods:")
-    for m in genai.list_models():
-        print(f"Model Name: {m.name}")
-        print(f"  Supported Methods: {m.supported_generation_methods}")
-        print("-" * 30)
\ No newline at end of file
+    models = load_models(api_key, offline="--offline" in sys.argv[1:])
+    if models is None:
+        print("No cached model list for today (run without --offline to fetch).")
+    else:
+        print("Available Models and their Supported Generation Methods:")
+        for name, methods in models:
+            print(f"Model Name: {name}")
+            print(f"  Supported Methods: {methods}")
+            print("-" * 30)
@@ -1,51 +1,100 @@
+import sys
+
+import numpy as np
 import pandas as pd
-import json
+from pathlib import Path
 
-# 데이터 로드
-features_df = pd.read_csv("raw_data/training_features.csv")
-labels_df = pd.read_csv("raw_data/event_labels.csv")
+try:
+    import orjson
 
-print("=== 학습 결과 분석 ===")
-print(f"총 레코드 수: {len(features_df)}")
-print(f'종목 수: {features_df["ticker"].nunique()}')
-print(f'기간: {features_df["date"].min()} ~ {features_df["date"].max()}')
+    json_loads = orjson.loads
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    import json
 
-print("\n=== 이벤트 분포 ===")
-print(
-    f'주요 이벤트 발생: {labels_df["major_event"].sum()}회 ({labels_df["major_event"].mean():.2%})'
-)
-print(f'가격 이벤트: {(labels_df["price_event"] != 0).sum()}회')
-print(f'거래량 이벤트: {labels_df["volume_event"].sum()}회')
-print(f'변동성 이벤트: {labels_df["volatility_event"].sum()}회')
+    json_loads = json.loads
+
+EVENT_COLUMNS = ["major_event", "price_event", "volume_event", "volatility_event"]
+CACHE_DIR = Path("raw_data/.cache")
+
+
+def load_cached(csv_path, columns):
+    """CSV를 처음 한 번만 Parquet로 변환해 두고 이후에는 Parquet에서 필요한 컬럼만 읽음"""
+    csv_path = Path(csv_path)
+    parquet_path = CACHE_DIR / (csv_path.stem + ".parquet")
+    if (
+        not parquet_path.exists()
+        or parquet_path.stat().st_mtime < csv_path.stat().st_mtime
+    ):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        pd.read_csv(csv_path, engine="pyarrow").to_parquet(
+            parquet_path, compression="zstd"
+        )
+    return pd.read_parquet(parquet_path, columns=columns)
+
+
+# 데이터 로드 (분석에 필요한 컬럼만 읽음)
+features_df = load_cached("raw_data/training_features.csv", ["ticker", "date"])
+labels_df = load_cached("raw_data/event_labels.csv", ["ticker"] + EVENT_COLUMNS)
 
-print("\n=== 종목별 이벤트 ===")
+# 종목 코드는 반복되는 문자열이므로 범주형으로 바꿔 groupby/nunique가 정수 코드로 동작하게 함
+for df in (features_df, labels_df):
+    df["ticker"] = df["ticker"].astype("category")
+features_df["date"] = pd.to_datetime(features_df["date"], cache=True)
+
+# 출력은 모아 두었다가 마지막에 한 번에 기록
+out = ["=== 학습 결과 분석 ==="]
+out.append(f"총 레코드 수: {len(features_df)}")
+out.append(f'종목 수: {features_df["ticker"].nunique()}')
+date_min, date_max = features_df["date"].min(), features_df["date"].max()
+out.append(f"기간: {date_min:%Y-%m-%d} ~ {date_max:%Y-%m-%d}")
+
+# 이벤트 컬럼은 0/1 (가격 이벤트는 -1/0/1) 이므로 0이 아닌 값의 개수가 곧 발생 횟수
+event_nz = labels_df[EVENT_COLUMNS].to_numpy() != 0
+event_counts = event_nz.sum(axis=0)
+major_count, price_count, volume_count, volatility_count = event_counts.tolist()
+
+out.append("\n=== 이벤트 분포 ===")
+out.append(f"주요 이벤트 발생: {major_count}회 ({major_count / len(labels_df):.2%})")
+out.append(f"가격 이벤트: {price_count}회")
+out.append(f"거래량 이벤트: {volume_count}회")
+out.append(f"변동성 이벤트: {volatility_count}회")
+
+out.append("\n=== 종목별 이벤트 ===")
+# 가격 이벤트는 부호(+/-)가 있으므로 0이 아닌 값을 미리 불리언으로 변환해 두고 합산
+labels_df["price_event_nz"] = event_nz[:, EVENT_COLUMNS.index("price_event")]
 ticker_stats = (
-    labels_df.groupby("ticker")
+    labels_df.groupby("ticker", sort=False, observed=True)
     .agg(
-        {
-            "major_event": "sum",
-            "price_event": lambda x: (x != 0).sum(),
-            "volume_event": "sum",
-            "volatility_event": "sum",
-        }
+        major_event=("major_event", "sum"),
+        price_event=("price_event_nz", "sum"),
+        volume_event=("volume_event", "sum"),
+        volatility_event=("volatility_event", "sum"),
     )
     .round(2)
 )
-print(ticker_stats)
+out.append(ticker_stats.to_string())
 
 # 모델 성능 로드
-with open("raw_data/model_performance.json", "r") as f:
-    performance = json.load(f)
+with open("raw_data/model_performance.json", "rb") as f:
+    performance = json_loads(f.read())
 
-print("\n=== 모델 성능 ===")
+out.append("\n=== 모델 성능 ===")
 for model_name, scores in performance.items():
-    print(f"{model_name}:")
-    print(f'  훈련 정확도: {scores["train_score"]:.4f}')
-    print(f'  테스트 정확도: {scores["test_score"]:.4f}')
-    print()
+    out.append(f"{model_name}:")
+    out.append(f'  훈련 정확도: {scores["train_score"]:.4f}')
+    out.append(f'  테스트 정확도: {scores["test_score"]:.4f}')
+    out.append("")
 
 # 최고 성능 모델
-best_model = max(performance.items(), key=lambda x: x[1]["test_score"])
-print(
+model_items = list(performance.items())
+test_scores = np.fromiter(
+    (scores["test_score"] for _, scores in model_items),
+    dtype=np.float64,
+    count=len(model_items),
+)
+best_model = model_items[int(test_scores.argmax())]
+out.append(
     f'🏆 최고 성능 모델: {best_model[0]} (테스트 정확도: {best_model[1]["test_score"]:.4f})'
 )
+
+sys.stdout.write("\n".join(out) + "\n")
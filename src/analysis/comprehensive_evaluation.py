@@ -6,8 +6,10 @@
 import pandas as pd
 import numpy as np
 import json
+import matplotlib
+
+matplotlib.use("Agg")  # 보고서 생성용: GUI 백엔드 초기화 없이 파일로만 저장
 import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.metrics import (
     accuracy_score,
     precision_score,
@@ -20,179 +22,242 @@ from sklearn.metrics import (
     balanced_accuracy_score,
 )
 from scipy import stats
+from scipy.linalg.blas import dsyrk
+from scipy.special import erfc
 from scipy.stats import wilcoxon, friedmanchisquare
+import math
 import warnings
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import NamedTuple, Optional
+
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 NumPy 구현 사용
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr 미설치 시 NumPy 구현 사용
+    ne = None
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
 warnings.filterwarnings("ignore")
 
 
+# 메트릭 함수 호출 방식 (evaluate_single_model에서 인자 구성에 사용)
+KIND_YPRED = 0  # fn(y_true, y_pred)
+KIND_FINANCIAL = 1  # fn(ctx: _EvalCtx)
+KIND_YPROBA = 2  # fn(y_true, y_pred_proba)
+KIND_PROBA_CTX = 3  # fn(ctx: _EvalCtx), y_pred_proba가 있을 때만
+
+_METRIC_KINDS = {
+    "roc_auc": KIND_YPROBA,
+    "calibration_error": KIND_YPROBA,
+    "prediction_confidence": KIND_PROBA_CTX,
+    "prediction_entropy": KIND_PROBA_CTX,
+}
+
+
+def _roc_auc(y_true, y_pred_proba):
+    if y_pred_proba.ndim > 1:
+        return roc_auc_score(y_true, y_pred_proba[:, 1])
+    return roc_auc_score(y_true, y_pred_proba)
+
+
+def _calibration_error_numpy(y_true, y_pred_proba, n_bins):
+    # 구간은 (lower, upper] 이므로 ceil(p * n_bins) - 1 이 구간 번호 (p == 0은 어느 구간에도 속하지 않음)
+    bin_idx = np.ceil(y_pred_proba * n_bins).astype(np.int64) - 1
+    valid = (bin_idx >= 0) & (bin_idx < n_bins)
+    bin_idx = bin_idx[valid]
+    sum_pred = np.bincount(bin_idx, weights=y_pred_proba[valid], minlength=n_bins)
+    sum_true = np.bincount(bin_idx, weights=y_true[valid], minlength=n_bins)
+    # |평균 신뢰도 - 정확도| * (구간 비율) == |구간 확률 합 - 구간 정답 합| / N
+    return np.abs(sum_pred - sum_true).sum() / len(y_pred_proba)
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _calibration_error_kernel(y_true, y_pred_proba, n_bins):
+        sum_pred = np.zeros(n_bins)
+        sum_true = np.zeros(n_bins)
+        for i in range(y_pred_proba.shape[0]):
+            p = y_pred_proba[i]
+            idx = int(np.ceil(p * n_bins)) - 1
+            if idx < 0 or idx >= n_bins:
+                continue
+            sum_pred[idx] += p
+            sum_true[idx] += y_true[i]
+
+        total = 0.0
+        for b in range(n_bins):
+            total += abs(sum_pred[b] - sum_true[b])
+        return total / y_pred_proba.shape[0]
+
+else:
+    _calibration_error_kernel = _calibration_error_numpy
+
+
+# 엔트로피 계산 시 log(0) 방지용 값 (float32 확률에서도 p + eps != p 가 되도록 1e-7 사용)
+ENTROPY_EPS = 1e-7
+
+# 낮을수록 좋은 메트릭 (모델 순위 정렬 방향)
+LOWER_IS_BETTER_METRICS = frozenset(
+    {"log_loss", "max_drawdown", "calibration_error", "prediction_entropy"}
+)
+
+# 상관관계 히트맵에 셀 값을 표시할 최대 메트릭 수 (셀마다 텍스트 아티스트가 생성됨)
+MAX_ANNOTATED_METRICS = 15
+
+
+def _replace_non_finite(obj):
+    """보고서 안의 inf/NaN 실수를 None으로 바꾼 사본 (dict/list/배열은 재귀적으로 처리)"""
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _replace_non_finite(obj.tolist())
+    if isinstance(obj, (float, np.floating)):
+        return obj if math.isfinite(obj) else None
+    return obj
+
+
+def _mcnemar_p_value(model1_correct, model2_correct):
+    if model1_correct + model2_correct == 0:
+        return 1.0  # 차이가 없음
+
+    # McNemar 통계량 (연속성 보정). 자유도 1인 카이제곱의 생존함수는 erfc(sqrt(x / 2))
+    mcnemar_stat = (abs(model1_correct - model2_correct) - 1) ** 2 / (
+        model1_correct + model2_correct
+    )
+    return math.erfc(math.sqrt(mcnemar_stat / 2.0))
+
+
+class FinancialCore(NamedTuple):
+    """금융 메트릭들이 공유하는 전략 수익률 통계"""
+
+    gross_profit: float
+    gross_loss: float
+    mean: float
+    std: float
+    max_drawdown: float
+    win_rate: float
+
+
+def _financial_core(strategy_returns):
+    """전략 수익률에서 모든 금융 메트릭의 기초 통계를 한 번에 계산"""
+    if len(strategy_returns) == 0:
+        return FinancialCore(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    cumulative_returns = np.cumsum(strategy_returns)
+    running_max = np.maximum.accumulate(cumulative_returns)
+    return FinancialCore(
+        gross_profit=strategy_returns[strategy_returns > 0].sum(),
+        # 손실 수익률은 모두 음수이므로 절댓값 합 == -합 (abs 임시 배열 불필요)
+        gross_loss=-strategy_returns[strategy_returns < 0].sum(),
+        mean=strategy_returns.mean(),
+        std=strategy_returns.std(),
+        max_drawdown=(cumulative_returns - running_max).min(),
+        win_rate=np.count_nonzero(strategy_returns > 0) / strategy_returns.size,
+    )
+
+
+@dataclass
+class _EvalCtx:
+    """evaluate_single_model 한 번 동안 공유되는 입력과 중간 계산 결과"""
+
+    y_true: np.ndarray
+    y_pred: np.ndarray
+    y_pred_proba: Optional[np.ndarray]
+    returns: np.ndarray
+    mask: np.ndarray  # 정답을 맞힌 예측
+    strategy_returns: np.ndarray  # 정답을 맞힌 예측의 수익률
+    financial: FinancialCore
+    # (평균 신뢰도, 평균 엔트로피): 두 신뢰도 메트릭이 이 평가 안에서만 공유
+    confidence_entropy: Optional[tuple] = None
+
+    @classmethod
+    def build(cls, y_true, y_pred, returns, y_pred_proba=None):
+        try:
+            mask = np.equal(y_true, y_pred)
+        except TypeError:  # ufunc를 지원하지 않는 object/문자열 배열
+            mask = np.asarray(y_true == y_pred, dtype=bool)
+        strategy_returns = returns[mask]
+        return cls(
+            y_true=y_true,
+            y_pred=y_pred,
+            y_pred_proba=y_pred_proba,
+            returns=returns,
+            mask=mask,
+            strategy_returns=strategy_returns,
+            financial=_financial_core(strategy_returns),
+        )
+
+
 class ComprehensiveEvaluator:
-    def __init__(self, results_dir="experiments/results"):
+    def __init__(self, results_dir="experiments/results", random_state=42, dpi=150):
         self.results_dir = results_dir
+        # 대시보드 PNG는 화면용이므로 150 DPI (인쇄용이 필요하면 300 지정)
+        self._dpi = dpi
+        # 수익률이 주어지지 않았을 때 사용할 기본 수익률 생성기
+        self.random_state = random_state
+        self._rng = np.random.default_rng(random_state)
+        self._trend_bufs = None
         self.evaluation_metrics = self.define_evaluation_metrics()
+        # 메트릭 정의(재정의 포함)를 평가 순서대로 평탄화한 계획은 인스턴스당 한 번만 생성
+        self._metric_plan = self._build_metric_plan()
         self.statistical_tests = self.define_statistical_tests()
 
+    def __getstate__(self):
+        # 프로세스 풀로 보낼 때 이전 평가의 캐시(배열 참조)는 전송하지 않음
+        state = self.__dict__.copy()
+        state["_trend_bufs"] = None
+        return state
+
     def define_evaluation_metrics(self):
-        """평가 메트릭 정의"""
+        """평가 메트릭 정의 (모듈 상수 EVALUATION_METRICS, 임포트 시 한 번만 생성)
 
-        return {
-            # 1. 기본 분류 메트릭
-            "basic_classification": {
-                "accuracy": {
-                    "function": accuracy_score,
-                    "description": "Overall classification accuracy",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "precision_macro": {
-                    "function": lambda y_true, y_pred: precision_score(
-                        y_true, y_pred, average="macro", zero_division=0
-                    ),
-                    "description": "Macro-averaged precision",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "recall_macro": {
-                    "function": lambda y_true, y_pred: recall_score(
-                        y_true, y_pred, average="macro", zero_division=0
-                    ),
-                    "description": "Macro-averaged recall",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "f1_macro": {
-                    "function": lambda y_true, y_pred: f1_score(
-                        y_true, y_pred, average="macro", zero_division=0
-                    ),
-                    "description": "Macro-averaged F1 score",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "precision_weighted": {
-                    "function": lambda y_true, y_pred: precision_score(
-                        y_true, y_pred, average="weighted", zero_division=0
-                    ),
-                    "description": "Weighted precision",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "recall_weighted": {
-                    "function": lambda y_true, y_pred: recall_score(
-                        y_true, y_pred, average="weighted", zero_division=0
-                    ),
-                    "description": "Weighted recall",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "f1_weighted": {
-                    "function": lambda y_true, y_pred: f1_score(
-                        y_true, y_pred, average="weighted", zero_division=0
-                    ),
-                    "description": "Weighted F1 score",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-            },
-            # 2. 고급 분류 메트릭
-            "advanced_classification": {
-                "balanced_accuracy": {
-                    "function": balanced_accuracy_score,
-                    "description": "Balanced accuracy (accounts for class imbalance)",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "matthews_corrcoef": {
-                    "function": matthews_corrcoef,
-                    "description": "Matthews correlation coefficient",
-                    "interpretation": "Higher is better (-1 to 1 range)",
-                },
-                "cohen_kappa": {
-                    "function": cohen_kappa_score,
-                    "description": "Cohen's kappa coefficient",
-                    "interpretation": "Higher is better (-1 to 1 range)",
-                },
-                "roc_auc": {
-                    "function": lambda y_true, y_pred_proba: (
-                        roc_auc_score(y_true, y_pred_proba[:, 1])
-                        if y_pred_proba.ndim > 1
-                        else roc_auc_score(y_true, y_pred_proba)
-                    ),
-                    "description": "Area under ROC curve",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "log_loss": {
-                    "function": log_loss,
-                    "description": "Logarithmic loss",
-                    "interpretation": "Lower is better (0 to inf)",
-                },
-            },
-            # 3. 금융 특화 메트릭
-            "financial_metrics": {
-                "profit_factor": {
-                    "function": self.calculate_profit_factor,
-                    "description": "Ratio of gross profit to gross loss",
-                    "interpretation": "Higher is better (>1 is profitable)",
-                },
-                "sharpe_ratio": {
-                    "function": self.calculate_sharpe_ratio,
-                    "description": "Risk-adjusted return measure",
-                    "interpretation": "Higher is better (>1 is good)",
-                },
-                "max_drawdown": {
-                    "function": self.calculate_max_drawdown,
-                    "description": "Maximum peak-to-trough decline",
-                    "interpretation": "Lower is better (negative values)",
-                },
-                "win_rate": {
-                    "function": self.calculate_win_rate,
-                    "description": "Percentage of profitable predictions",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "avg_return": {
-                    "function": self.calculate_avg_return,
-                    "description": "Average return per prediction",
-                    "interpretation": "Higher is better",
-                },
-                "volatility": {
-                    "function": self.calculate_volatility,
-                    "description": "Standard deviation of returns",
-                    "interpretation": "Lower is better for risk management",
-                },
-                "information_ratio": {
-                    "function": self.calculate_information_ratio,
-                    "description": "Active return divided by tracking error",
-                    "interpretation": "Higher is better",
-                },
-            },
-            # 4. 시간 기반 메트릭
-            "temporal_metrics": {
-                "temporal_consistency": {
-                    "function": self.calculate_temporal_consistency,
-                    "description": "Consistency of predictions over time",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "trend_accuracy": {
-                    "function": self.calculate_trend_accuracy,
-                    "description": "Accuracy in predicting trend direction",
-                    "interpretation": "Higher is better (0-1 range)",
-                },
-                "lag_correlation": {
-                    "function": self.calculate_lag_correlation,
-                    "description": "Correlation between predictions and lagged reality",
-                    "interpretation": "Higher is better (-1 to 1 range)",
-                },
-            },
-            # 5. 예측 신뢰도 메트릭
-            "confidence_metrics": {
-                "prediction_confidence": {
-                    "function": self.calculate_prediction_confidence,
-                    "description": "Average confidence of predictions",
-                    "interpretation": "Higher confidence indicates more certain predictions",
-                },
-                "calibration_error": {
-                    "function": self.calculate_calibration_error,
-                    "description": "Difference between predicted and actual probabilities",
-                    "interpretation": "Lower is better (well-calibrated model)",
-                },
-                "prediction_entropy": {
-                    "function": self.calculate_prediction_entropy,
-                    "description": "Entropy of prediction distribution",
-                    "interpretation": "Lower entropy indicates more confident predictions",
-                },
-            },
-        }
+        각 메트릭은 "function"(호출 가능 객체) 또는 "method"(평가기 메서드 이름)를 가집니다.
+        """
+
+        return EVALUATION_METRICS
+
+    def _build_metric_plan(self):
+        """중첩된 메트릭 정의를 평가 순서대로 평탄화
+
+        각 항목은 (kind, 카테고리, 이름, 함수, 설명, 해석) 입니다.
+        "method"로 지정된 평가기 메서드는 이 인스턴스에 바인딩해 하위 클래스의 재정의를 따릅니다.
+        """
+        plan = []
+        for category_name, metrics in self.evaluation_metrics.items():
+            for metric_name, metric_info in metrics.items():
+                if "method" in metric_info:
+                    function = getattr(self, metric_info["method"])
+                else:
+                    function = metric_info["function"]
+                if category_name == "financial_metrics":
+                    kind = KIND_FINANCIAL
+                else:
+                    kind = _METRIC_KINDS.get(metric_name, KIND_YPRED)
+                plan.append(
+                    (
+                        kind,
+                        category_name,
+                        metric_name,
+                        function,
+                        metric_info["description"],
+                        metric_info["interpretation"],
+                    )
+                )
+        return tuple(plan)
 
     def define_statistical_tests(self):
         """통계적 검증 테스트 정의"""
@@ -221,112 +286,77 @@ class ComprehensiveEvaluator:
         }
 
     # 금융 메트릭 계산 함수들
-    def calculate_profit_factor(self, y_true, y_pred, returns=None):
+    # (evaluate_single_model은 평가마다 한 번 만든 _EvalCtx를 받는 _ 메서드를 직접 사용)
+    def _profit_factor(self, ctx):
         """수익 팩터 계산"""
-        if returns is None:
-            returns = np.random.normal(0, 0.02, len(y_true))  # 기본 수익률
+        core = ctx.financial
 
-        correct_predictions = y_true == y_pred
-        profitable_returns = returns[correct_predictions & (returns > 0)]
-        loss_returns = returns[correct_predictions & (returns < 0)]
+        if core.gross_loss == 0:
+            return float("inf") if core.gross_profit > 0 else 0
 
-        if len(loss_returns) == 0 or sum(abs(loss_returns)) == 0:
-            return float("inf") if len(profitable_returns) > 0 else 0
+        return core.gross_profit / core.gross_loss
 
-        return sum(profitable_returns) / sum(abs(loss_returns))
-
-    def calculate_sharpe_ratio(self, y_true, y_pred, returns=None, risk_free_rate=0.02):
+    def _sharpe_ratio(self, ctx, risk_free_rate=0.02):
         """샤프 비율 계산"""
-        if returns is None:
-            returns = np.random.normal(0, 0.02, len(y_true))
-
-        correct_predictions = y_true == y_pred
-        strategy_returns = returns[correct_predictions]
+        core = ctx.financial
 
-        if len(strategy_returns) == 0:
+        if len(ctx.strategy_returns) == 0:
             return 0
 
-        excess_return = np.mean(strategy_returns) - risk_free_rate / 252
-        return_std = np.std(strategy_returns)
+        excess_return = core.mean - risk_free_rate / 252
 
-        if return_std == 0:
+        if core.std == 0:
             return 0
 
-        return excess_return / return_std * np.sqrt(252)
+        return excess_return / core.std * np.sqrt(252)
 
-    def calculate_max_drawdown(self, y_true, y_pred, returns=None):
+    def _max_drawdown(self, ctx):
         """최대 낙폭 계산"""
-        if returns is None:
-            returns = np.random.normal(0, 0.02, len(y_true))
+        core = ctx.financial
 
-        correct_predictions = y_true == y_pred
-        strategy_returns = returns[correct_predictions]
-
-        if len(strategy_returns) == 0:
+        if len(ctx.strategy_returns) == 0:
             return 0
 
-        cumulative_returns = np.cumsum(strategy_returns)
-        running_max = np.maximum.accumulate(cumulative_returns)
-        drawdown = cumulative_returns - running_max
-
-        return np.min(drawdown)
+        return core.max_drawdown
 
-    def calculate_win_rate(self, y_true, y_pred, returns=None):
+    def _win_rate(self, ctx):
         """승률 계산"""
-        if returns is None:
-            returns = np.random.normal(0, 0.02, len(y_true))
+        core = ctx.financial
 
-        correct_predictions = y_true == y_pred
-        strategy_returns = returns[correct_predictions]
-
-        if len(strategy_returns) == 0:
+        if len(ctx.strategy_returns) == 0:
             return 0
 
-        return np.mean(strategy_returns > 0)
+        return core.win_rate
 
-    def calculate_avg_return(self, y_true, y_pred, returns=None):
+    def _avg_return(self, ctx):
         """평균 수익률 계산"""
-        if returns is None:
-            returns = np.random.normal(0, 0.02, len(y_true))
-
-        correct_predictions = y_true == y_pred
-        strategy_returns = returns[correct_predictions]
+        core = ctx.financial
 
-        if len(strategy_returns) == 0:
+        if len(ctx.strategy_returns) == 0:
             return 0
 
-        return np.mean(strategy_returns)
+        return core.mean
 
-    def calculate_volatility(self, y_true, y_pred, returns=None):
+    def _volatility(self, ctx):
         """변동성 계산"""
-        if returns is None:
-            returns = np.random.normal(0, 0.02, len(y_true))
+        core = ctx.financial
 
-        correct_predictions = y_true == y_pred
-        strategy_returns = returns[correct_predictions]
-
-        if len(strategy_returns) == 0:
+        if len(ctx.strategy_returns) == 0:
             return 0
 
-        return np.std(strategy_returns) * np.sqrt(252)
+        return core.std * np.sqrt(252)
 
-    def calculate_information_ratio(
-        self, y_true, y_pred, returns=None, benchmark_returns=None
-    ):
+    def _information_ratio(self, ctx, benchmark_returns=None):
         """정보 비율 계산"""
-        if returns is None:
-            returns = np.random.normal(0, 0.02, len(y_true))
         if benchmark_returns is None:
-            benchmark_returns = np.random.normal(0, 0.01, len(y_true))
-
-        correct_predictions = y_true == y_pred
-        strategy_returns = returns[correct_predictions]
-        benchmark_returns = benchmark_returns[correct_predictions]
+            benchmark_returns = self._rng.normal(0, 0.01, len(ctx.y_true)).astype(
+                np.float32
+            )
 
-        if len(strategy_returns) == 0:
+        if len(ctx.strategy_returns) == 0:
             return 0
 
-        active_returns = strategy_returns - benchmark_returns
+        active_returns = ctx.strategy_returns - benchmark_returns[ctx.mask]
         tracking_error = np.std(active_returns)
 
         if tracking_error == 0:
@@ -334,6 +364,49 @@ class ComprehensiveEvaluator:
 
         return np.mean(active_returns) / tracking_error
 
+    def _financial_ctx(self, y_true, y_pred, returns):
+        """공개 금융 메트릭 메서드용 컨텍스트 (수익률이 없으면 기본 수익률 생성)"""
+        y_true = np.asarray(y_true)
+        if returns is None:
+            returns = self._rng.normal(0, 0.02, len(y_true)).astype(np.float32)
+        return _EvalCtx.build(y_true, np.asarray(y_pred), np.asarray(returns))
+
+    def calculate_profit_factor(self, y_true, y_pred, returns=None):
+        """수익 팩터 계산"""
+        return self._profit_factor(self._financial_ctx(y_true, y_pred, returns))
+
+    def calculate_sharpe_ratio(self, y_true, y_pred, returns=None, risk_free_rate=0.02):
+        """샤프 비율 계산"""
+        return self._sharpe_ratio(
+            self._financial_ctx(y_true, y_pred, returns), risk_free_rate
+        )
+
+    def calculate_max_drawdown(self, y_true, y_pred, returns=None):
+        """최대 낙폭 계산"""
+        return self._max_drawdown(self._financial_ctx(y_true, y_pred, returns))
+
+    def calculate_win_rate(self, y_true, y_pred, returns=None):
+        """승률 계산"""
+        return self._win_rate(self._financial_ctx(y_true, y_pred, returns))
+
+    def calculate_avg_return(self, y_true, y_pred, returns=None):
+        """평균 수익률 계산"""
+        return self._avg_return(self._financial_ctx(y_true, y_pred, returns))
+
+    def calculate_volatility(self, y_true, y_pred, returns=None):
+        """변동성 계산"""
+        return self._volatility(self._financial_ctx(y_true, y_pred, returns))
+
+    def calculate_information_ratio(
+        self, y_true, y_pred, returns=None, benchmark_returns=None
+    ):
+        """정보 비율 계산"""
+        if benchmark_returns is not None:
+            benchmark_returns = np.asarray(benchmark_returns)
+        return self._information_ratio(
+            self._financial_ctx(y_true, y_pred, returns), benchmark_returns
+        )
+
     # 시간 기반 메트릭 계산 함수들
     def calculate_temporal_consistency(self, y_true, y_pred, timestamps=None):
         """시간적 일관성 계산"""
@@ -342,94 +415,140 @@ class ComprehensiveEvaluator:
 
         # 시간 윈도우별 정확도 계산
         window_size = max(10, len(y_true) // 10)
-        accuracies = []
+        offsets = np.arange(0, len(y_true) - window_size, window_size)
 
-        for i in range(0, len(y_true) - window_size, window_size):
-            window_accuracy = accuracy_score(
-                y_true[i : i + window_size], y_pred[i : i + window_size]
-            )
-            accuracies.append(window_accuracy)
-
-        if len(accuracies) == 0:
+        if len(offsets) == 0:
             return 0
 
+        # 마지막 윈도우 뒤의 나머지 구간은 제외 (reduceat은 마지막 구간을 배열 끝까지 합산)
+        n_used = len(offsets) * window_size
+        correct = np.equal(y_true[:n_used], y_pred[:n_used]).astype(np.int32)
+        accuracies = np.add.reduceat(correct, offsets) / window_size
+
         # 일관성은 정확도의 변동성이 낮을수록 높음
         return 1 - np.std(accuracies)
 
+    def _trend_buffers(self, n):
+        """추세 비교용 불리언 버퍼 (지금까지 본 최대 길이로 한 번 할당해 재사용)"""
+        buffers = self._trend_bufs
+        if buffers is None or buffers[0].size < n:
+            buffers = tuple(np.empty(n, dtype=bool) for _ in range(3))
+            self._trend_bufs = buffers
+        return tuple(buffer[:n] for buffer in buffers)
+
     def calculate_trend_accuracy(self, y_true, y_pred, values=None):
         """추세 정확도 계산"""
         if values is None:
-            values = np.random.normal(0, 0.02, len(y_true))
+            values = self._rng.normal(0, 0.02, len(y_true))
 
         if len(values) < 2:
             return 0
 
-        # 실제 추세와 예측 추세 비교
-        actual_trend = np.diff(values) > 0
-        predicted_trend = y_pred[1:] > y_pred[:-1]
-
-        if len(actual_trend) == 0:
-            return 0
+        # 실제 추세와 예측 추세 비교 (diff 임시 배열 없이 미리 할당한 버퍼에 기록)
+        n = len(values) - 1
+        actual_trend, predicted_trend, agree = self._trend_buffers(n)
+        np.greater(values[1:], values[:-1], out=actual_trend)
+        np.greater(y_pred[1:], y_pred[:-1], out=predicted_trend)
+        np.equal(actual_trend, predicted_trend, out=agree)
 
-        return np.mean(actual_trend == predicted_trend)
+        return np.count_nonzero(agree) / n
 
     def calculate_lag_correlation(self, y_true, y_pred, max_lag=5):
         """지연 상관관계 계산"""
+        n = len(y_true)
+        lags = range(1, min(max_lag + 1, n // 4))
+        if len(lags) == 0:
+            return 0
+
+        # 상관계수는 평행이동에 불변이므로 전역 평균으로 한 번 중심화 (수치 안정성)
+        y_t = np.asarray(y_true, dtype=np.float64)
+        y_p = np.asarray(y_pred, dtype=np.float64)
+        y_t = y_t - y_t.mean()
+        y_p = y_p - y_p.mean()
+
+        # 구간별 합/제곱합은 누적합으로 O(1)에 구함
+        cum_t = np.concatenate(([0.0], np.cumsum(y_t)))
+        cum_tt = np.concatenate(([0.0], np.cumsum(y_t * y_t)))
+        cum_p = np.concatenate(([0.0], np.cumsum(y_p)))
+        cum_pp = np.concatenate(([0.0], np.cumsum(y_p * y_p)))
+
         max_correlation = 0
+        for lag in lags:
+            m = n - lag  # y_true[:-lag] 와 y_pred[lag:] 의 길이
+            sum_t, sum_tt = cum_t[m], cum_tt[m]
+            sum_p, sum_pp = cum_p[n] - cum_p[lag], cum_pp[n] - cum_pp[lag]
+
+            var_t = sum_tt - sum_t * sum_t / m
+            var_p = sum_pp - sum_p * sum_p / m
+            if var_t <= 0 or var_p <= 0:
+                continue  # 분산이 0이면 상관계수 정의 불가 (corrcoef의 NaN)
 
-        for lag in range(1, min(max_lag + 1, len(y_true) // 4)):
-            if len(y_true) > lag:
-                correlation = np.corrcoef(y_true[:-lag], y_pred[lag:])[0, 1]
-                if not np.isnan(correlation):
-                    max_correlation = max(max_correlation, abs(correlation))
+            cross = np.dot(y_t[:m], y_p[lag:]) - sum_t * sum_p / m
+            correlation = cross / np.sqrt(var_t * var_p)
+            max_correlation = max(max_correlation, abs(correlation))
 
         return max_correlation
 
     # 신뢰도 메트릭 계산 함수들
-    def calculate_prediction_confidence(self, y_pred_proba):
-        """예측 신뢰도 계산"""
+    def _confidence_entropy(self, y_pred_proba):
+        """평균 신뢰도와 평균 엔트로피를 함께 계산"""
+        n_samples = len(y_pred_proba)
         if y_pred_proba.ndim > 1:
-            confidence = np.max(y_pred_proba, axis=1)
+            confidence = np.max(y_pred_proba, axis=1).mean()
+            expr = "sum(-p * log(p + eps))"
+        else:
+            confidence = (np.abs(y_pred_proba - 0.5) + 0.5).mean()
+            expr = "sum(-((1 - p) * log(1 - p + eps) + p * log(p + eps)))"
+
+        # 샘플별 엔트로피의 평균 == 전체 합 / 샘플 수 (임시 배열 없이 한 번에 합산)
+        if ne is not None:
+            entropy_sum = ne.evaluate(
+                expr, local_dict={"p": y_pred_proba, "eps": ENTROPY_EPS}
+            )
+        elif y_pred_proba.ndim > 1:
+            entropy_sum = -np.sum(y_pred_proba * np.log(y_pred_proba + ENTROPY_EPS))
         else:
-            confidence = np.abs(y_pred_proba - 0.5) + 0.5
+            proba_0 = 1 - y_pred_proba
+            entropy_sum = -np.sum(
+                proba_0 * np.log(proba_0 + ENTROPY_EPS)
+                + y_pred_proba * np.log(y_pred_proba + ENTROPY_EPS)
+            )
+
+        return confidence, float(entropy_sum) / n_samples if n_samples else np.nan
 
-        return np.mean(confidence)
+    def _ctx_confidence_entropy(self, ctx):
+        """평가 한 번 안에서 신뢰도/엔트로피를 한 번만 계산해 두 메트릭이 공유"""
+        if ctx.confidence_entropy is None:
+            ctx.confidence_entropy = self._confidence_entropy(ctx.y_pred_proba)
+        return ctx.confidence_entropy
+
+    def _prediction_confidence(self, ctx):
+        return self._ctx_confidence_entropy(ctx)[0]
+
+    def _prediction_entropy(self, ctx):
+        return self._ctx_confidence_entropy(ctx)[1]
+
+    def calculate_prediction_confidence(self, y_pred_proba):
+        """예측 신뢰도 계산"""
+        return self._confidence_entropy(y_pred_proba)[0]
 
     def calculate_calibration_error(self, y_true, y_pred_proba, n_bins=10):
         """보정 오차 계산"""
         if y_pred_proba.ndim > 1:
             y_pred_proba = y_pred_proba[:, 1]
 
-        bin_boundaries = np.linspace(0, 1, n_bins + 1)
-        bin_lowers = bin_boundaries[:-1]
-        bin_uppers = bin_boundaries[1:]
-
-        calibration_error = 0
-        for bin_lower, bin_upper in zip(bin_lowers, bin_uppers):
-            in_bin = (y_pred_proba > bin_lower) & (y_pred_proba <= bin_upper)
-            prop_in_bin = in_bin.mean()
-
-            if prop_in_bin > 0:
-                accuracy_in_bin = y_true[in_bin].mean()
-                avg_confidence_in_bin = y_pred_proba[in_bin].mean()
-                calibration_error += (
-                    np.abs(avg_confidence_in_bin - accuracy_in_bin) * prop_in_bin
-                )
+        if len(y_pred_proba) == 0:
+            return 0
 
-        return calibration_error
+        return _calibration_error_kernel(
+            np.asarray(y_true, dtype=np.float64),
+            np.ascontiguousarray(y_pred_proba),
+            n_bins,
+        )
 
     def calculate_prediction_entropy(self, y_pred_proba):
         """예측 엔트로피 계산"""
-        if y_pred_proba.ndim > 1:
-            entropy = -np.sum(y_pred_proba * np.log(y_pred_proba + 1e-15), axis=1)
-        else:
-            proba_0 = 1 - y_pred_proba
-            proba_1 = y_pred_proba
-            entropy = -(
-                proba_0 * np.log(proba_0 + 1e-15) + proba_1 * np.log(proba_1 + 1e-15)
-            )
-
-        return np.mean(entropy)
+        return self._confidence_entropy(y_pred_proba)[1]
 
     # 통계적 검증 함수들
     def mcnemar_test(self, y_true, y_pred1, y_pred2):
@@ -442,64 +561,168 @@ class ComprehensiveEvaluator:
         model1_correct = np.sum(correct1 & ~correct2)
         model2_correct = np.sum(~correct1 & correct2)
 
-        # McNemar 통계량
-        if model1_correct + model2_correct == 0:
-            return 1.0  # 차이가 없음
-
-        mcnemar_stat = (abs(model1_correct - model2_correct) - 1) ** 2 / (
-            model1_correct + model2_correct
+        return _mcnemar_p_value(model1_correct, model2_correct)
+
+    def mcnemar_test_pairwise(self, y_true, predictions):
+        """모든 모델 쌍의 McNemar 테스트 (행렬 곱으로 분할표를 한 번에 계산)"""
+        model_names = list(predictions.keys())
+        correct = (
+            np.asarray(y_true)[None, :]
+            == np.stack([np.asarray(predictions[name]) for name in model_names])
+        ).astype(np.int32)
+
+        # discordant[i, j]: 모델 i만 맞히고 모델 j는 틀린 샘플 수
+        discordant = correct @ (1 - correct).T
+        total = discordant + discordant.T
+        mcnemar_stat = (np.abs(discordant - discordant.T) - 1) ** 2 / np.maximum(
+            total, 1
         )
-        p_value = 1 - stats.chi2.cdf(mcnemar_stat, 1)
+        p_values = erfc(np.sqrt(mcnemar_stat / 2.0))
+        p_values[total == 0] = 1.0  # 차이가 없음
 
-        return p_value
+        return {
+            f"{model_names[i]}_vs_{model_names[j]}": float(p_values[i, j])
+            for i in range(len(model_names))
+            for j in range(i + 1, len(model_names))
+        }
 
-    def evaluate_single_model(self, y_true, y_pred, y_pred_proba=None, returns=None):
-        """단일 모델 종합 평가"""
+    def evaluate_single_model(
+        self, y_true, y_pred, y_pred_proba=None, returns=None, random_seed=None
+    ):
+        """단일 모델 종합 평가
+
+        random_seed를 주면 이 평가의 기본 수익률/벤치마크를 그 시드의 난수로 생성합니다
+        (평가기의 공유 난수 상태는 사용하지도 진행시키지도 않음).
+        """
+        if random_seed is not None:
+            shared_rng = self._rng
+            self._rng = np.random.default_rng(random_seed)
+            try:
+                return self.evaluate_single_model(y_true, y_pred, y_pred_proba, returns)
+            finally:
+                self._rng = shared_rng
+
+        # 리스트나 pandas Series 입력도 위치 기반 배열 연산을 하도록 ndarray로 통일
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        if returns is not None:
+            returns = np.asarray(returns)
 
-        evaluation_results = {}
+        if returns is None:
+            # 기본 수익률은 평가당 한 번만 생성해 모든 금융 메트릭이 공유
+            returns = self._rng.normal(0, 0.02, len(y_true)).astype(np.float32)
+
+        # 확률 기반 메트릭은 소수점 4자리 수준이면 충분하므로 float32로 한 번 변환 (대역폭 절반)
+        if y_pred_proba is not None:
+            try:
+                y_pred_proba = np.asarray(y_pred_proba, dtype=np.float32)
+            except (TypeError, ValueError):  # 변환 실패는 확률 메트릭별 오류로 기록
+                y_pred_proba = np.asarray(y_pred_proba)
+
+        # 정답 마스크와 전략 수익률 통계는 모든 금융 메트릭이 공유하도록 한 번만 계산
+        # (실패하면 금융 메트릭마다 같은 오류를 기록)
+        ctx_error = None
+        try:
+            ctx = _EvalCtx.build(y_true, y_pred, returns, y_pred_proba)
+        except Exception as e:
+            ctx, ctx_error = None, e
+
+        evaluation_results = {category: {} for category in self.evaluation_metrics}
+
+        for (
+            kind,
+            category_name,
+            metric_name,
+            function,
+            description,
+            interpretation,
+        ) in self._metric_plan:
+            if kind == KIND_YPRED:
+                args = (y_true, y_pred)
+            elif kind == KIND_FINANCIAL:
+                args = (ctx,)
+            elif y_pred_proba is None:
+                continue
+            elif kind == KIND_YPROBA:
+                args = (y_true, y_pred_proba)
+            else:
+                args = (ctx,)
+
+            # 메트릭 하나의 실패가 전체 평가를 중단하지 않도록 메트릭마다 오류를 기록
+            try:
+                if ctx is None and kind in (KIND_FINANCIAL, KIND_PROBA_CTX):
+                    raise ctx_error
+                evaluation_results[category_name][metric_name] = {
+                    "score": float(function(*args)),
+                    "description": description,
+                    "interpretation": interpretation,
+                }
+            except Exception as e:
+                evaluation_results[category_name][metric_name] = {
+                    "score": None,
+                    "error": str(e),
+                    "description": description,
+                    "interpretation": interpretation,
+                }
 
-        # 각 메트릭 카테고리별 평가
-        for category_name, metrics in self.evaluation_metrics.items():
-            evaluation_results[category_name] = {}
+        return evaluation_results
 
-            for metric_name, metric_info in metrics.items():
-                try:
-                    if (
-                        category_name == "advanced_classification"
-                        and metric_name == "roc_auc"
-                    ):
-                        if y_pred_proba is not None:
-                            score = metric_info["function"](y_true, y_pred_proba)
-                        else:
-                            continue
-                    elif category_name == "financial_metrics":
-                        score = metric_info["function"](y_true, y_pred, returns)
-                    elif category_name == "confidence_metrics":
-                        if y_pred_proba is not None:
-                            if metric_name == "calibration_error":
-                                score = metric_info["function"](y_true, y_pred_proba)
-                            else:
-                                score = metric_info["function"](y_pred_proba)
-                        else:
-                            continue
-                    else:
-                        score = metric_info["function"](y_true, y_pred)
-
-                    evaluation_results[category_name][metric_name] = {
-                        "score": float(score),
-                        "description": metric_info["description"],
-                        "interpretation": metric_info["interpretation"],
-                    }
-
-                except Exception as e:
-                    evaluation_results[category_name][metric_name] = {
-                        "score": None,
-                        "error": str(e),
-                        "description": metric_info["description"],
-                        "interpretation": metric_info["interpretation"],
-                    }
+    def evaluate_models_parallel(self, predictions, n_workers=None):
+        """여러 모델을 프로세스 풀에서 병렬로 평가
 
-        return evaluation_results
+        predictions: {모델명: (y_true, y_pred, y_pred_proba, returns)}
+        기본 수익률은 모델별 시드로 생성하므로 결과가 n_workers나 실행 방식에 따라 달라지지 않습니다.
+        """
+        seeds = {model_name: self._model_seed(model_name) for model_name in predictions}
+
+        if n_workers == 1 or len(predictions) <= 1:
+            return {
+                model_name: self.evaluate_single_model(
+                    *args, random_seed=seeds[model_name]
+                )
+                for model_name, args in predictions.items()
+            }
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {
+                model_name: executor.submit(
+                    self.evaluate_single_model, *args, random_seed=seeds[model_name]
+                )
+                for model_name, args in predictions.items()
+            }
+            return {
+                model_name: future.result() for model_name, future in futures.items()
+            }
+
+    def _model_seed(self, model_name):
+        """평가기 시드와 모델명으로 정해지는 모델별 시드 (프로세스 간에도 동일)"""
+        name_hash = zlib.crc32(str(model_name).encode("utf-8"))
+        if self.random_state is None:
+            return name_hash
+        return [self.random_state, name_hash]
+
+    def build_score_matrix(self, model_results, metric_keys=None):
+        """(메트릭 x 모델) 점수 행렬 생성 (없거나 실패한 점수는 NaN)
+
+        metric_keys를 주지 않으면 EVALUATION_METRICS에 정의된 메트릭 순서를 사용합니다.
+        """
+        if metric_keys is None:
+            metric_keys = [
+                (category_name, metric_name)
+                for category_name, metrics in self.evaluation_metrics.items()
+                for metric_name in metrics
+            ]
+        model_names = list(model_results.keys())
+        scores_matrix = np.full((len(metric_keys), len(model_names)), np.nan)
+
+        for j, model_name in enumerate(model_names):
+            model_result = model_results[model_name]
+            for i, (category_name, metric_name) in enumerate(metric_keys):
+                metric_result = model_result.get(category_name, {}).get(metric_name)
+                if metric_result is not None and metric_result["score"] is not None:
+                    scores_matrix[i, j] = metric_result["score"]
+
+        return metric_keys, model_names, scores_matrix
 
     def compare_models(self, model_results):
         """모델 간 비교 분석"""
@@ -510,44 +733,34 @@ class ComprehensiveEvaluator:
             "performance_summary": {},
         }
 
-        # 각 메트릭별 모델 순위
-        for category_name, metrics in self.evaluation_metrics.items():
-            comparison_results["model_rankings"][category_name] = {}
+        # 각 메트릭별 모델 순위: (메트릭 x 모델) 점수 행렬을 한 번에 정렬
+        metric_keys, model_names, scores_matrix = self.build_score_matrix(model_results)
+        direction = np.array(
+            [
+                -1.0 if metric_name in LOWER_IS_BETTER_METRICS else 1.0
+                for _, metric_name in metric_keys
+            ]
+        )
+        # 결측(NaN)은 argsort에서 항상 뒤로 가므로 유효 개수만큼만 사용
+        order = np.argsort(-direction[:, None] * scores_matrix, axis=1, kind="stable")
+        valid_counts = (~np.isnan(scores_matrix)).sum(axis=1)
 
-            for metric_name in metrics.keys():
-                scores = {}
-
-                for model_name, model_result in model_results.items():
-                    if (
-                        category_name in model_result
-                        and metric_name in model_result[category_name]
-                        and model_result[category_name][metric_name]["score"]
-                        is not None
-                    ):
-                        scores[model_name] = model_result[category_name][metric_name][
-                            "score"
-                        ]
-
-                if scores:
-                    # 메트릭에 따른 정렬 (높을수록 좋은 메트릭 vs 낮을수록 좋은 메트릭)
-                    reverse_sort = metric_name not in [
-                        "log_loss",
-                        "max_drawdown",
-                        "calibration_error",
-                        "prediction_entropy",
-                    ]
-                    sorted_models = sorted(
-                        scores.items(), key=lambda x: x[1], reverse=reverse_sort
-                    )
+        for category_name in self.evaluation_metrics:
+            comparison_results["model_rankings"][category_name] = {}
 
-                    comparison_results["model_rankings"][category_name][metric_name] = {
-                        "ranking": [
-                            {"model": model, "score": score}
-                            for model, score in sorted_models
-                        ],
-                        "best_model": sorted_models[0][0],
-                        "best_score": sorted_models[0][1],
-                    }
+        for i, (category_name, metric_name) in enumerate(metric_keys):
+            if valid_counts[i] == 0:
+                continue
+
+            ranking = [
+                {"model": model_names[j], "score": scores_matrix[i, j].item()}
+                for j in order[i, : valid_counts[i]]
+            ]
+            comparison_results["model_rankings"][category_name][metric_name] = {
+                "ranking": ranking,
+                "best_model": ranking[0]["model"],
+                "best_score": ranking[0]["score"],
+            }
 
         # 통계적 유의성 검증
         if len(model_results) >= 2:
@@ -582,18 +795,37 @@ class ComprehensiveEvaluator:
     def generate_comprehensive_report(self, model_results, output_path=None):
         """종합 평가 보고서 생성"""
 
+        comparative_analysis = self.compare_models(model_results)
+
         report = {
             "evaluation_timestamp": pd.Timestamp.now().isoformat(),
             "total_models": len(model_results),
             "individual_evaluations": model_results,
-            "comparative_analysis": self.compare_models(model_results),
+            "comparative_analysis": comparative_analysis,
             "summary_statistics": self.generate_summary_statistics(model_results),
-            "recommendations": self.generate_recommendations(model_results),
+            "recommendations": self.generate_recommendations(
+                model_results, comparative_analysis
+            ),
         }
 
         if output_path:
-            with open(output_path, "w") as f:
-                json.dump(report, f, indent=2, default=str)
+            # inf/NaN 점수(예: 손실이 없을 때의 profit_factor)는 orjson이면 null,
+            # 표준 json이면 Infinity/NaN이 되므로 직렬화 전에 None으로 통일
+            serializable = _replace_non_finite(report)
+            if orjson is not None:
+                with open(output_path, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            serializable,
+                            default=str,
+                            option=orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_INDENT_2
+                            | orjson.OPT_NON_STR_KEYS,
+                        )
+                    )
+            else:
+                with open(output_path, "w") as f:
+                    json.dump(serializable, f, indent=2, default=str)
 
         return report
 
@@ -602,31 +834,36 @@ class ComprehensiveEvaluator:
 
         summary = {"metric_statistics": {}, "model_statistics": {}}
 
-        # 메트릭별 통계
-        for category_name, metrics in self.evaluation_metrics.items():
+        # 메트릭별 통계: 점수 행렬의 각 행(메트릭)에 대해 한 번에 축 방향 집계
+        metric_keys, _, scores_matrix = self.build_score_matrix(model_results)
+        counts = (~np.isnan(scores_matrix)).sum(axis=1)
+        has_scores = counts > 0
+        stats_matrix = np.full((5, len(metric_keys)), np.nan)
+        if has_scores.any():
+            valid_rows = scores_matrix[has_scores]
+            stats_matrix[:, has_scores] = [
+                np.nanmean(valid_rows, axis=1),
+                np.nanstd(valid_rows, axis=1),
+                np.nanmin(valid_rows, axis=1),
+                np.nanmax(valid_rows, axis=1),
+                np.nanmedian(valid_rows, axis=1),
+            ]
+
+        for category_name in self.evaluation_metrics:
             summary["metric_statistics"][category_name] = {}
 
-            for metric_name in metrics.keys():
-                scores = []
-
-                for model_result in model_results.values():
-                    if (
-                        category_name in model_result
-                        and metric_name in model_result[category_name]
-                        and model_result[category_name][metric_name]["score"]
-                        is not None
-                    ):
-                        scores.append(model_result[category_name][metric_name]["score"])
-
-                if scores:
-                    summary["metric_statistics"][category_name][metric_name] = {
-                        "mean": np.mean(scores),
-                        "std": np.std(scores),
-                        "min": np.min(scores),
-                        "max": np.max(scores),
-                        "median": np.median(scores),
-                        "count": len(scores),
-                    }
+        for i, (category_name, metric_name) in enumerate(metric_keys):
+            if not has_scores[i]:
+                continue
+            mean, std, min_, max_, median = stats_matrix[:, i].tolist()
+            summary["metric_statistics"][category_name][metric_name] = {
+                "mean": mean,
+                "std": std,
+                "min": min_,
+                "max": max_,
+                "median": median,
+                "count": int(counts[i]),
+            }
 
         # 모델별 통계
         for model_name, model_result in model_results.items():
@@ -655,8 +892,8 @@ class ComprehensiveEvaluator:
 
         return summary
 
-    def generate_recommendations(self, model_results):
-        """권장사항 생성"""
+    def generate_recommendations(self, model_results, comparison_results=None):
+        """권장사항 생성 (compare_models 결과가 이미 있으면 재사용)"""
 
         recommendations = {
             "best_overall_model": None,
@@ -699,7 +936,8 @@ class ComprehensiveEvaluator:
             }
 
         # 카테고리별 최고 성능 모델
-        comparison_results = self.compare_models(model_results)
+        if comparison_results is None:
+            comparison_results = self.compare_models(model_results)
 
         for category_name, metrics in comparison_results["model_rankings"].items():
             category_winners = {}
@@ -742,80 +980,122 @@ class ComprehensiveEvaluator:
         if output_dir is None:
             output_dir = self.results_dir
 
-        # 1. 모델별 성능 비교 차트
-        self.plot_model_comparison(model_results, output_dir)
+        # 중첩된 결과 dict는 한 번만 점수 행렬로 펼쳐서 네 차트가 공유
+        score_matrix = self._result_score_matrix(model_results)
 
-        # 2. 메트릭별 분포 차트
-        self.plot_metric_distributions(model_results, output_dir)
+        # 네 차트가 하나의 Figure를 재사용 (차트마다 Figure/캔버스를 새로 만들지 않음)
+        fig = plt.figure(figsize=(15, 12))
+        try:
+            # 1. 모델별 성능 비교 차트
+            self.plot_model_comparison(model_results, output_dir, fig, score_matrix)
 
-        # 3. 상관관계 히트맵
-        self.plot_metric_correlations(model_results, output_dir)
+            # 2. 메트릭별 분포 차트
+            self.plot_metric_distributions(model_results, output_dir, fig, score_matrix)
 
-        # 4. 레이더 차트
-        self.plot_radar_chart(model_results, output_dir)
+            # 3. 상관관계 히트맵
+            self.plot_metric_correlations(model_results, output_dir, fig, score_matrix)
 
-    def plot_model_comparison(self, model_results, output_dir):
+            # 4. 레이더 차트
+            self.plot_radar_chart(model_results, output_dir, fig, score_matrix)
+        finally:
+            plt.close(fig)
+
+    @staticmethod
+    def _prepare_figure(fig, figsize, nrows=1, ncols=1, subplot_kw=None):
+        """재사용할 Figure가 있으면 비우고 크기만 바꿔 서브플롯을 생성"""
+        if fig is None:
+            fig = plt.figure(figsize=figsize)
+        else:
+            fig.clear()
+            fig.set_size_inches(figsize)
+        axes = fig.subplots(nrows, ncols, squeeze=False, subplot_kw=subplot_kw)
+        return fig, axes
+
+    def _result_score_matrix(self, model_results):
+        """결과에 실제로 들어 있는 메트릭(처음 나온 순서)으로 만든 점수 행렬
+
+        외부 결과(예: precision, recall, f1_score)도 차트에서 빠지지 않도록
+        EVALUATION_METRICS 정의 대신 model_results의 키를 사용합니다.
+        """
+        metric_keys = list(
+            dict.fromkeys(
+                (category_name, metric_name)
+                for model_result in model_results.values()
+                for category_name, metrics in model_result.items()
+                for metric_name in metrics
+            )
+        )
+        return self.build_score_matrix(model_results, metric_keys)
+
+    def _plot_scores(self, model_results, score_matrix=None):
+        """차트용 점수 행렬 (대시보드에서 만든 행렬이 있으면 다시 펼치지 않음)"""
+        if score_matrix is None:
+            score_matrix = self._result_score_matrix(model_results)
+        metric_keys, model_names, scores_matrix = score_matrix
+        metric_rows = {key: i for i, key in enumerate(metric_keys)}
+        return metric_rows, model_names, scores_matrix
+
+    def _save_figure(self, fig, path, reused):
+        # tight_layout을 한 번 적용한 뒤 저장 (bbox_inches="tight"의 이중 렌더링 회피)
+        fig.tight_layout()
+        fig.savefig(path, dpi=self._dpi)
+        if not reused:
+            plt.close(fig)
+
+    def plot_model_comparison(
+        self, model_results, output_dir, fig=None, score_matrix=None
+    ):
         """모델 비교 차트"""
 
         metrics_to_plot = ["accuracy", "precision_macro", "recall_macro", "f1_macro"]
+        metric_rows, model_names, scores_matrix = self._plot_scores(
+            model_results, score_matrix
+        )
 
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        reused = fig is not None
+        fig, axes = self._prepare_figure(fig, (15, 12), 2, 2)
         axes = axes.flatten()
 
-        for i, metric in enumerate(metrics_to_plot):
-            if i < len(axes):
-                scores = {}
-
-                for model_name, model_result in model_results.items():
-                    if (
-                        "basic_classification" in model_result
-                        and metric in model_result["basic_classification"]
-                        and model_result["basic_classification"][metric]["score"]
-                        is not None
-                    ):
-                        scores[model_name] = model_result["basic_classification"][
-                            metric
-                        ]["score"]
+        for ax, metric in zip(axes, metrics_to_plot):
+            row = metric_rows.get(("basic_classification", metric))
+            if row is None:
+                continue
+            scores = scores_matrix[row]
+            has_score = ~np.isnan(scores)
 
-                if scores:
-                    models = list(scores.keys())
-                    values = list(scores.values())
+            if has_score.any():
+                models = [name for name, ok in zip(model_names, has_score) if ok]
 
-                    axes[i].bar(models, values)
-                    axes[i].set_title(f"{metric.capitalize()} Comparison")
-                    axes[i].set_ylabel("Score")
-                    axes[i].tick_params(axis="x", rotation=45)
+                ax.bar(models, scores[has_score])
+                ax.set_title(f"{metric.capitalize()} Comparison")
+                ax.set_ylabel("Score")
+                ax.tick_params(axis="x", rotation=45)
 
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/model_comparison.png", dpi=300, bbox_inches="tight")
-        plt.close()
+        self._save_figure(fig, f"{output_dir}/model_comparison.png", reused)
 
-    def plot_metric_distributions(self, model_results, output_dir):
+    def plot_metric_distributions(
+        self, model_results, output_dir, fig=None, score_matrix=None
+    ):
         """메트릭 분포 차트"""
 
-        all_scores = {}
-
-        for model_name, model_result in model_results.items():
-            for category_name, metrics in model_result.items():
-                for metric_name, metric_result in metrics.items():
-                    if metric_result["score"] is not None:
-                        if metric_name not in all_scores:
-                            all_scores[metric_name] = []
-                        all_scores[metric_name].append(metric_result["score"])
+        metric_rows, _, scores_matrix = self._plot_scores(model_results, score_matrix)
 
-        # 분포가 있는 메트릭만 플롯
-        metrics_with_data = {k: v for k, v in all_scores.items() if len(v) > 1}
+        # 분포가 있는 메트릭만 플롯 (점수 행렬의 행에서 NaN만 제외)
+        metrics_with_data = {}
+        for (_, metric_name), row in metric_rows.items():
+            scores = scores_matrix[row]
+            scores = scores[~np.isnan(scores)]
+            if len(scores) > 1:
+                metrics_with_data[metric_name] = scores
 
         if metrics_with_data:
             n_metrics = len(metrics_with_data)
             n_cols = 3
             n_rows = (n_metrics + n_cols - 1) // n_cols
 
-            fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 5 * n_rows))
-            if n_rows == 1:
-                axes = [axes] if n_cols == 1 else axes
-            else:
-                axes = axes.flatten()
+            reused = fig is not None
+            fig, axes = self._prepare_figure(fig, (15, 5 * n_rows), n_rows, n_cols)
+            axes = axes.flatten()
 
             for i, (metric_name, scores) in enumerate(metrics_with_data.items()):
                 if i < len(axes):
@@ -828,71 +1108,88 @@ class ComprehensiveEvaluator:
             for i in range(len(metrics_with_data), len(axes)):
                 axes[i].remove()
 
-            plt.tight_layout()
-            plt.savefig(
-                f"{output_dir}/metric_distributions.png", dpi=300, bbox_inches="tight"
-            )
-            plt.close()
+            self._save_figure(fig, f"{output_dir}/metric_distributions.png", reused)
 
-    def plot_metric_correlations(self, model_results, output_dir):
+    def plot_metric_correlations(
+        self, model_results, output_dir, fig=None, score_matrix=None
+    ):
         """메트릭 상관관계 히트맵"""
 
-        # 모델별 메트릭 데이터 수집
-        metric_data = {}
-
-        for model_name, model_result in model_results.items():
-            model_metrics = {}
-
-            for category_name, metrics in model_result.items():
-                for metric_name, metric_result in metrics.items():
-                    if metric_result["score"] is not None:
-                        model_metrics[metric_name] = metric_result["score"]
-
-            metric_data[model_name] = model_metrics
+        metric_rows, _, scores_matrix = self._plot_scores(model_results, score_matrix)
+
+        # 점수가 하나도 없는 메트릭만 제외 (모델 x 메트릭)
+        missing = np.isnan(scores_matrix)
+        has_scores = ~missing.all(axis=1)
+        X = scores_matrix[has_scores].T
+        metric_names = [
+            name for (_, name), keep in zip(metric_rows, has_scores) if keep
+        ]
+
+        if X.shape[0] > 1 and X.shape[1] > 1:
+            if missing[has_scores].any():
+                # 일부 모델에만 없는 메트릭(예: 확률이 없는 모델의 roc_auc)이 있으면
+                # DataFrame.corr처럼 메트릭 쌍마다 두 점수가 모두 있는 모델만으로 계산
+                corr = pd.DataFrame(X).corr().to_numpy()
+            else:
+                # 상관관계 계산: 한 번 표준화한 뒤 Z^T Z / n
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    Z = (X - X.mean(axis=0)) / X.std(axis=0, ddof=0)
+                # 대칭 행렬이므로 BLAS syrk로 상삼각만 계산 (하삼각은 히트맵에서 마스킹)
+                corr = dsyrk(1.0 / len(Z), Z, trans=1)
+
+            reused = fig is not None
+            fig, axes = self._prepare_figure(fig, (12, 10))
+            ax = axes[0, 0]
+            # 중복되는 하삼각 셀은 마스킹해 그리지 않음 (셀 단위 QuadMesh 대신 이미지 한 장)
+            n_metrics = len(metric_names)
+            lower = np.tril(np.ones_like(corr, dtype=bool), k=-1)
+            im = ax.imshow(
+                np.ma.masked_array(corr, mask=lower),
+                cmap="coolwarm",
+                vmin=-1,
+                vmax=1,
+                aspect="auto",
+            )
+            ax.set_xticks(range(n_metrics))
+            ax.set_xticklabels(metric_names, rotation=45, ha="right")
+            ax.set_yticks(range(n_metrics))
+            ax.set_yticklabels(metric_names)
+            fig.colorbar(im, ax=ax, shrink=0.8)
 
-        # DataFrame 생성
-        df = pd.DataFrame(metric_data).T
+            if n_metrics <= MAX_ANNOTATED_METRICS:
+                for i, j in zip(*np.nonzero(~lower)):
+                    ax.text(j, i, f"{corr[i, j]:.2f}", ha="center", va="center")
 
-        # 상관관계 계산
-        if len(df) > 1 and len(df.columns) > 1:
-            correlation_matrix = df.corr()
+            ax.set_title("Metric Correlations")
+            self._save_figure(fig, f"{output_dir}/metric_correlations.png", reused)
 
-            plt.figure(figsize=(12, 10))
-            sns.heatmap(correlation_matrix, annot=True, cmap="coolwarm", center=0)
-            plt.title("Metric Correlations")
-            plt.tight_layout()
-            plt.savefig(
-                f"{output_dir}/metric_correlations.png", dpi=300, bbox_inches="tight"
-            )
-            plt.close()
-
-    def plot_radar_chart(self, model_results, output_dir):
+    def plot_radar_chart(self, model_results, output_dir, fig=None, score_matrix=None):
         """레이더 차트"""
 
         # 주요 메트릭 선택
         key_metrics = ["accuracy", "precision_macro", "recall_macro", "f1_macro"]
+        metric_rows, model_names, scores_matrix = self._plot_scores(
+            model_results, score_matrix
+        )
 
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection="polar"))
-
-        angles = np.linspace(0, 2 * np.pi, len(key_metrics), endpoint=False).tolist()
-        angles += angles[:1]  # 원형 완성
+        reused = fig is not None
+        fig, axes = self._prepare_figure(
+            fig, (10, 10), subplot_kw=dict(projection="polar")
+        )
+        ax = axes[0, 0]
 
-        for model_name, model_result in model_results.items():
-            values = []
-
-            for metric in key_metrics:
-                if (
-                    "basic_classification" in model_result
-                    and metric in model_result["basic_classification"]
-                    and model_result["basic_classification"][metric]["score"]
-                    is not None
-                ):
-                    values.append(model_result["basic_classification"][metric]["score"])
-                else:
-                    values.append(0)
+        angles = np.linspace(0, 2 * np.pi, len(key_metrics), endpoint=False)
+        angles = np.append(angles, angles[0])  # 원형 완성
 
-            values += values[:1]  # 원형 완성
+        # 주요 메트릭 행만 골라 (모델 수, 메트릭 수) 배열로 (없는 점수는 0)
+        scores = np.zeros((len(model_names), len(key_metrics)))
+        for k, metric in enumerate(key_metrics):
+            row = metric_rows.get(("basic_classification", metric))
+            if row is not None:
+                scores[:, k] = np.nan_to_num(scores_matrix[row], nan=0.0)
+        scores = np.concatenate([scores, scores[:, :1]], axis=1)  # 원형 완성
 
+        for model_name, values in zip(model_names, scores):
             ax.plot(angles, values, "o-", linewidth=2, label=model_name)
             ax.fill(angles, values, alpha=0.25)
 
@@ -902,9 +1199,153 @@ class ComprehensiveEvaluator:
         ax.set_title("Model Performance Radar Chart")
         ax.legend(loc="upper right", bbox_to_anchor=(1.2, 1.0))
 
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/radar_chart.png", dpi=300, bbox_inches="tight")
-        plt.close()
+        self._save_figure(fig, f"{output_dir}/radar_chart.png", reused)
+
+
+# 메트릭 정의는 모든 평가기 인스턴스가 공유 (인스턴스 생성 시 재구성하지 않음).
+# 평가기 메서드는 "method"에 이름으로 지정하고 평가 계획을 만들 때 인스턴스에 바인딩
+EVALUATION_METRICS = {
+    # 1. 기본 분류 메트릭
+    "basic_classification": {
+        "accuracy": {
+            "function": accuracy_score,
+            "description": "Overall classification accuracy",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "precision_macro": {
+            "function": partial(precision_score, average="macro", zero_division=0),
+            "description": "Macro-averaged precision",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "recall_macro": {
+            "function": partial(recall_score, average="macro", zero_division=0),
+            "description": "Macro-averaged recall",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "f1_macro": {
+            "function": partial(f1_score, average="macro", zero_division=0),
+            "description": "Macro-averaged F1 score",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "precision_weighted": {
+            "function": partial(precision_score, average="weighted", zero_division=0),
+            "description": "Weighted precision",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "recall_weighted": {
+            "function": partial(recall_score, average="weighted", zero_division=0),
+            "description": "Weighted recall",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "f1_weighted": {
+            "function": partial(f1_score, average="weighted", zero_division=0),
+            "description": "Weighted F1 score",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+    },
+    # 2. 고급 분류 메트릭
+    "advanced_classification": {
+        "balanced_accuracy": {
+            "function": balanced_accuracy_score,
+            "description": "Balanced accuracy (accounts for class imbalance)",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "matthews_corrcoef": {
+            "function": matthews_corrcoef,
+            "description": "Matthews correlation coefficient",
+            "interpretation": "Higher is better (-1 to 1 range)",
+        },
+        "cohen_kappa": {
+            "function": cohen_kappa_score,
+            "description": "Cohen's kappa coefficient",
+            "interpretation": "Higher is better (-1 to 1 range)",
+        },
+        "roc_auc": {
+            "function": _roc_auc,
+            "description": "Area under ROC curve",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "log_loss": {
+            "function": log_loss,
+            "description": "Logarithmic loss",
+            "interpretation": "Lower is better (0 to inf)",
+        },
+    },
+    # 3. 금융 특화 메트릭
+    "financial_metrics": {
+        "profit_factor": {
+            "method": "_profit_factor",
+            "description": "Ratio of gross profit to gross loss",
+            "interpretation": "Higher is better (>1 is profitable)",
+        },
+        "sharpe_ratio": {
+            "method": "_sharpe_ratio",
+            "description": "Risk-adjusted return measure",
+            "interpretation": "Higher is better (>1 is good)",
+        },
+        "max_drawdown": {
+            "method": "_max_drawdown",
+            "description": "Maximum peak-to-trough decline",
+            "interpretation": "Lower is better (negative values)",
+        },
+        "win_rate": {
+            "method": "_win_rate",
+            "description": "Percentage of profitable predictions",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "avg_return": {
+            "method": "_avg_return",
+            "description": "Average return per prediction",
+            "interpretation": "Higher is better",
+        },
+        "volatility": {
+            "method": "_volatility",
+            "description": "Standard deviation of returns",
+            "interpretation": "Lower is better for risk management",
+        },
+        "information_ratio": {
+            "method": "_information_ratio",
+            "description": "Active return divided by tracking error",
+            "interpretation": "Higher is better",
+        },
+    },
+    # 4. 시간 기반 메트릭
+    "temporal_metrics": {
+        "temporal_consistency": {
+            "method": "calculate_temporal_consistency",
+            "description": "Consistency of predictions over time",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "trend_accuracy": {
+            "method": "calculate_trend_accuracy",
+            "description": "Accuracy in predicting trend direction",
+            "interpretation": "Higher is better (0-1 range)",
+        },
+        "lag_correlation": {
+            "method": "calculate_lag_correlation",
+            "description": "Correlation between predictions and lagged reality",
+            "interpretation": "Higher is better (-1 to 1 range)",
+        },
+    },
+    # 5. 예측 신뢰도 메트릭
+    "confidence_metrics": {
+        "prediction_confidence": {
+            "method": "_prediction_confidence",
+            "description": "Average confidence of predictions",
+            "interpretation": "Higher confidence indicates more certain predictions",
+        },
+        "calibration_error": {
+            "method": "calculate_calibration_error",
+            "description": "Difference between predicted and actual probabilities",
+            "interpretation": "Lower is better (well-calibrated model)",
+        },
+        "prediction_entropy": {
+            "method": "_prediction_entropy",
+            "description": "Entropy of prediction distribution",
+            "interpretation": "Lower entropy indicates more confident predictions",
+        },
+    },
+}
 
 
 if __name__ == "__main__":
@@ -4,21 +4,42 @@
 """
 
 import json
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # 파일 저장 전용 (GUI 백엔드 초기화 생략)
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba_array
 from datetime import datetime
 import seaborn as sns
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+WRITE_BUFFER_SIZE = 1 << 16
+
+# 스타일 설정 (호출마다 스타일시트를 다시 적용하지 않도록 import 시 한 번만)
+plt.style.use("default")
+sns.set_palette("husl")
+
+# 위험도 구간 경계 (get_risk_level과 동일: 경계값은 낮은 등급에 포함)
+RISK_THRESHOLDS = [0.5, 0.65, 0.75]
+RISK_LEVELS = ("NORMAL", "LOW", "MEDIUM", "HIGH")
+PROBABILITY_COLORS = to_rgba_array(["green", "orange", "red"])
+
 
 def create_realtime_report():
     """실시간 테스트 결과 분석 리포트 생성"""
 
     # 결과 데이터 로드
-    with open("raw_data/realtime_test_results.json", "r") as f:
-        results = json.load(f)
+    with open("raw_data/realtime_test_results.json", "rb") as f:
+        results = orjson.loads(f.read()) if orjson else json.load(f)
 
     # 훈련 성능 데이터 로드
-    with open("raw_data/model_performance.json", "r") as f:
-        training_performance = json.load(f)
+    with open("raw_data/model_performance.json", "rb") as f:
+        training_performance = orjson.loads(f.read()) if orjson else json.load(f)
 
     # 분석 수행
     analysis = analyze_results(results, training_performance)
@@ -35,42 +56,58 @@ def create_realtime_report():
 def analyze_results(results, training_performance):
     """결과 분석"""
 
-    test_timestamp = datetime.fromisoformat(results["test_timestamp"])
+    # ISO 형식(YYYY-MM-DDTHH:MM:SS...)이므로 파싱 없이 문자열로 바로 변환
+    test_timestamp = results["test_timestamp"].replace("T", " ")[:19]
     model_used = results["model_used"]
 
+    # 전체 통계 (한 번 배열로 변환해 벡터 연산으로 집계)
+    n_results = len(results["results"])
+    event_probs = np.fromiter(
+        (r["prediction"]["event_probability"] for r in results["results"]),
+        dtype=np.float64,
+        count=n_results,
+    )
+    confidences = np.fromiter(
+        (r["prediction"]["confidence"] for r in results["results"]),
+        dtype=np.float64,
+        count=n_results,
+    )
+
+    # 위험도 구간 분류를 한 번에 수행 (0: NORMAL, 1: LOW, 2: MEDIUM, 3: HIGH)
+    risk_bins = np.digitize(event_probs, RISK_THRESHOLDS, right=True)
+    normal_count, low_count, medium_count, high_count = np.bincount(
+        risk_bins, minlength=len(RISK_LEVELS)
+    ).tolist()
+
     # 종목별 결과 정리
     ticker_results = {}
-    for result in results["results"]:
-        ticker = result["ticker"]
+    for result, risk_bin in zip(results["results"], risk_bins.tolist()):
         pred = result["prediction"]
 
-        ticker_results[ticker] = {
+        ticker_results[result["ticker"]] = {
             "current_price": result["current_price"],
             "event_probability": pred["event_probability"],
             "confidence": pred["confidence"],
             "prediction": pred["prediction"],
-            "risk_level": get_risk_level(pred["event_probability"]),
+            "risk_level": RISK_LEVELS[risk_bin],
         }
 
-    # 전체 통계
-    event_probs = [r["prediction"]["event_probability"] for r in results["results"]]
-    confidences = [r["prediction"]["confidence"] for r in results["results"]]
-
     analysis = {
         "test_info": {
-            "timestamp": test_timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": test_timestamp,
             "model_used": model_used,
             "model_training_accuracy": training_performance[model_used]["test_score"],
-            "total_stocks": len(results["results"]),
+            "total_stocks": n_results,
         },
         "predictions": {
-            "avg_event_probability": sum(event_probs) / len(event_probs),
-            "max_event_probability": max(event_probs),
-            "min_event_probability": min(event_probs),
-            "avg_confidence": sum(confidences) / len(confidences),
-            "high_risk_count": sum(1 for p in event_probs if p > 0.65),
-            "medium_risk_count": sum(1 for p in event_probs if 0.5 < p <= 0.65),
-            "low_risk_count": sum(1 for p in event_probs if p <= 0.5),
+            "avg_event_probability": float(event_probs.mean()),
+            "max_event_probability": float(event_probs.max()),
+            "min_event_probability": float(event_probs.min()),
+            "avg_confidence": float(confidences.mean()),
+            "high_risk_count": high_count,
+            "medium_risk_count": medium_count,
+            "low_risk_count": low_count,
+            "normal_risk_count": normal_count,
         },
         "ticker_results": ticker_results,
         "market_outlook": generate_market_outlook(ticker_results),
@@ -110,59 +147,38 @@ def generate_market_outlook(ticker_results):
     return outlook
 
 
-def create_visualizations(results, analysis):
+def create_visualizations(results, analysis, dpi=150):
     """시각화 생성"""
 
-    # 스타일 설정
-    plt.style.use("default")
-    sns.set_palette("husl")
-
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
 
     # 1. 종목별 이벤트 확률
     tickers = [r["ticker"] for r in results["results"]]
-    event_probs = [
-        r["prediction"]["event_probability"] * 100 for r in results["results"]
-    ]
-
-    bars = axes[0, 0].bar(
-        tickers,
-        event_probs,
-        color=[
-            "red" if p > 65 else "orange" if p > 50 else "green" for p in event_probs
-        ],
+    event_probs = np.fromiter(
+        (r["prediction"]["event_probability"] for r in results["results"]),
+        dtype=np.float64,
+        count=len(tickers),
     )
+    event_probs *= 100
+
+    # 막대 색상은 구간 인덱스로 RGBA 테이블에서 한 번에 조회 (50% 이하 초록, 65% 이하 주황)
+    color_idx = np.digitize(event_probs, [50, 65], right=True)
+    bars = axes[0, 0].bar(tickers, event_probs, color=PROBABILITY_COLORS[color_idx])
     axes[0, 0].set_title("종목별 이벤트 발생 확률")
     axes[0, 0].set_ylabel("확률 (%)")
     axes[0, 0].set_ylim(0, 100)
 
-    # 값 표시
-    for bar, prob in zip(bars, event_probs):
-        axes[0, 0].text(
-            bar.get_x() + bar.get_width() / 2,
-            bar.get_height() + 1,
-            f"{prob:.3f}%",
-            ha="center",
-            va="bottom",
-            fontsize=8,
-        )
+    # 값 표시 (막대마다 text를 만들지 않고 bar_label 한 번으로 처리)
+    axes[0, 0].bar_label(bars, fmt="%.3f%%", padding=1, fontsize=8)
 
     # 2. 종목별 현재 가격
     current_prices = [r["current_price"] for r in results["results"]]
-    axes[0, 1].bar(tickers, current_prices, color="skyblue")
+    price_bars = axes[0, 1].bar(tickers, current_prices, color="skyblue")
     axes[0, 1].set_title("종목별 현재 가격")
     axes[0, 1].set_ylabel("가격 ($)")
 
     # 값 표시
-    for i, (ticker, price) in enumerate(zip(tickers, current_prices)):
-        axes[0, 1].text(
-            i,
-            price + max(current_prices) * 0.01,
-            f"${price:.2f}",
-            ha="center",
-            va="bottom",
-            fontsize=8,
-        )
+    axes[0, 1].bar_label(price_bars, fmt="$%.2f", padding=1, fontsize=8)
 
     # 3. 위험도 분포
     risk_levels = ["HIGH", "MEDIUM", "LOW", "NORMAL"]
@@ -170,10 +186,7 @@ def create_visualizations(results, analysis):
         analysis["predictions"]["high_risk_count"],
         analysis["predictions"]["medium_risk_count"],
         analysis["predictions"]["low_risk_count"],
-        len(results["results"])
-        - analysis["predictions"]["high_risk_count"]
-        - analysis["predictions"]["medium_risk_count"]
-        - analysis["predictions"]["low_risk_count"],
+        analysis["predictions"]["normal_risk_count"],
     ]
 
     colors = ["red", "orange", "yellow", "green"]
@@ -184,22 +197,17 @@ def create_visualizations(results, analysis):
 
     # 4. 신뢰도 분포
     confidences = [r["prediction"]["confidence"] * 100 for r in results["results"]]
-    axes[1, 1].bar(tickers, confidences, color="lightgreen")
+    confidence_bars = axes[1, 1].bar(tickers, confidences, color="lightgreen")
     axes[1, 1].set_title("종목별 예측 신뢰도")
     axes[1, 1].set_ylabel("신뢰도 (%)")
     axes[1, 1].set_ylim(0, 100)
 
     # 값 표시
-    for i, (ticker, conf) in enumerate(zip(tickers, confidences)):
-        axes[1, 1].text(
-            i, conf + 1, f"{conf:.1f}%", ha="center", va="bottom", fontsize=8
-        )
+    axes[1, 1].bar_label(confidence_bars, fmt="%.1f%%", padding=1, fontsize=8)
 
-    plt.tight_layout()
-    plt.savefig(
-        "raw_data/realtime_test_visualization.png", dpi=300, bbox_inches="tight"
-    )
-    plt.close()
+    fig.tight_layout()
+    fig.savefig("raw_data/realtime_test_visualization.png", dpi=dpi)
+    plt.close(fig)
 
     print("✅ 시각화 생성 완료: raw_data/realtime_test_visualization.png")
 
@@ -211,6 +219,17 @@ def create_markdown_report(results, analysis):
     predictions = analysis["predictions"]
     ticker_results = analysis["ticker_results"]
 
+    # 표 행은 리스트에 모았다가 한 번에 결합 (문자열 += 반복 시 매번 재할당)
+    rows = []
+    for ticker, result in ticker_results.items():
+        action = get_recommended_action(result["risk_level"])
+        rows.append(
+            f"| {ticker} | ${result['current_price']:.2f} "
+            f"| {result['event_probability']:.4%} | {result['confidence']:.4%} "
+            f"| {result['risk_level']} | {action} |\n"
+        )
+    ticker_rows = "".join(rows)
+
     report = f"""# S&P500 실시간 이벤트 탐지 테스트 결과
 
 ## 📊 테스트 개요
@@ -236,13 +255,7 @@ def create_markdown_report(results, analysis):
 
 | 종목 | 현재 가격 | 이벤트 확률 | 신뢰도 | 위험도 | 권장 조치 |
 |------|-----------|-------------|--------|--------|-----------|
-"""
-
-    for ticker, result in ticker_results.items():
-        action = get_recommended_action(result["risk_level"])
-        report += f"| {ticker} | ${result['current_price']:.2f} | {result['event_probability']:.4%} | {result['confidence']:.4%} | {result['risk_level']} | {action} |\n"
-
-    report += f"""
+{ticker_rows}
 ## 🔍 시장 전망
 
 {analysis['market_outlook']}
@@ -278,8 +291,10 @@ def create_markdown_report(results, analysis):
 *Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
 
-    with open("raw_data/REALTIME_TEST_REPORT.md", "w") as f:
-        f.write(report)
+    # 인코딩한 바이트를 큰 버퍼로 한 번에 기록 (텍스트 모드 개행 변환 생략)
+    report_path = "raw_data/REALTIME_TEST_REPORT.md"
+    with open(report_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(report.encode("utf-8"))
 
     print("✅ 마크다운 리포트 생성 완료: raw_data/REALTIME_TEST_REPORT.md")
 
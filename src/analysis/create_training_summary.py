@@ -1,9 +1,23 @@
 import pandas as pd
 import json
+import matplotlib
+
+matplotlib.use("Agg")  # 파일 저장 전용 (GUI 백엔드 초기화 생략)
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+WRITE_BUFFER_SIZE = 1 << 16
+
+# 스타일 설정 (호출마다 스타일시트를 다시 적용하지 않도록 import 시 한 번만)
+plt.style.use("default")
+sns.set_palette("husl")
+
 
 def create_training_summary():
     """학습 결과 요약 생성"""
@@ -12,8 +26,8 @@ def create_training_summary():
     features_df = pd.read_csv("raw_data/training_features.csv")
     labels_df = pd.read_csv("raw_data/event_labels.csv")
 
-    with open("raw_data/model_performance.json", "r") as f:
-        performance = json.load(f)
+    with open("raw_data/model_performance.json", "rb") as f:
+        performance = orjson.loads(f.read()) if orjson else json.load(f)
 
     # 요약 생성
     summary = {
@@ -37,21 +51,33 @@ def create_training_summary():
         },
         "model_performance": performance,
         "best_model": max(performance.items(), key=lambda x: x[1]["test_score"]),
-        "ticker_statistics": {},
     }
 
-    # 종목별 통계
-    for ticker in features_df["ticker"].unique():
-        ticker_data = labels_df[labels_df["ticker"] == ticker]
-        summary["ticker_statistics"][ticker] = {
-            "records": len(ticker_data),
-            "major_events": int(ticker_data["major_event"].sum()),
-            "event_rate": float(ticker_data["major_event"].mean()),
+    # 종목별 통계 (종목마다 전체 마스크를 만들지 않고 groupby 한 번으로 집계)
+    ticker_stats = (
+        labels_df.groupby("ticker", sort=False)["major_event"]
+        .agg(records="size", major_events="sum", event_rate="mean")
+        .reindex(summary["dataset_info"]["tickers"])
+        .fillna({"records": 0, "major_events": 0})
+    )
+    summary["ticker_statistics"] = {
+        ticker: {
+            "records": int(records),
+            "major_events": int(major_events),
+            "event_rate": float(event_rate),
         }
+        for ticker, records, major_events, event_rate in ticker_stats.itertuples()
+    }
 
     # 요약 저장
-    with open("raw_data/training_summary.json", "w") as f:
-        json.dump(summary, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(
+            summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    else:
+        payload = json.dumps(summary, indent=2).encode("utf-8")
+    with open("raw_data/training_summary.json", "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
 
     # 시각화 생성
     create_visualizations(summary, features_df, labels_df, performance)
@@ -59,13 +85,9 @@ def create_training_summary():
     return summary
 
 
-def create_visualizations(summary, features_df, labels_df, performance):
+def create_visualizations(summary, features_df, labels_df, performance, dpi=150):
     """시각화 생성"""
 
-    # 스타일 설정
-    plt.style.use("default")
-    sns.set_palette("husl")
-
     # 1. 모델 성능 비교
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
 
@@ -73,12 +95,13 @@ def create_visualizations(summary, features_df, labels_df, performance):
     models = list(performance.keys())
     test_scores = [performance[model]["test_score"] for model in models]
 
-    axes[0, 0].bar(models, test_scores, color=["skyblue", "lightgreen", "lightcoral"])
+    score_bars = axes[0, 0].bar(
+        models, test_scores, color=["skyblue", "lightgreen", "lightcoral"]
+    )
     axes[0, 0].set_title("모델별 테스트 정확도")
     axes[0, 0].set_ylabel("정확도")
     axes[0, 0].set_ylim(0.9, 1.0)
-    for i, v in enumerate(test_scores):
-        axes[0, 0].text(i, v + 0.001, f"{v:.4f}", ha="center", va="bottom")
+    axes[0, 0].bar_label(score_bars, fmt="%.4f", padding=1)
 
     # 종목별 이벤트 발생 횟수
     ticker_events = []
@@ -87,11 +110,10 @@ def create_visualizations(summary, features_df, labels_df, performance):
         tickers.append(ticker)
         ticker_events.append(stats["major_events"])
 
-    axes[0, 1].bar(tickers, ticker_events, color="orange")
+    event_bars = axes[0, 1].bar(tickers, ticker_events, color="orange")
     axes[0, 1].set_title("종목별 주요 이벤트 발생 횟수")
     axes[0, 1].set_ylabel("이벤트 수")
-    for i, v in enumerate(ticker_events):
-        axes[0, 1].text(i, v + 0.5, str(v), ha="center", va="bottom")
+    axes[0, 1].bar_label(event_bars, fmt="%d", padding=1)
 
     # 이벤트 타입별 분포
     event_types = ["가격 이벤트", "거래량 이벤트", "변동성 이벤트"]
@@ -106,13 +128,14 @@ def create_visualizations(summary, features_df, labels_df, performance):
 
     # 시계열 이벤트 발생 패턴
     try:
-        labels_df["date"] = pd.to_datetime(labels_df["Date"], utc=True)
-        monthly_events = labels_df.groupby(labels_df["date"].dt.to_period("M"))[
-            "major_event"
-        ].sum()
+        # 정렬된 DatetimeIndex에서 월초 기준 resample (PeriodIndex 변환 생략)
+        labels_df["date"] = pd.to_datetime(labels_df["Date"], utc=True, cache=True)
+        monthly_events = (
+            labels_df.set_index("date")["major_event"].sort_index().resample("MS").sum()
+        )
 
         axes[1, 1].plot(
-            monthly_events.index.astype(str), monthly_events.values, marker="o"
+            monthly_events.index.strftime("%Y-%m"), monthly_events.values, marker="o"
         )
         axes[1, 1].set_title("월별 이벤트 발생 패턴")
         axes[1, 1].set_ylabel("이벤트 수")
@@ -125,9 +148,9 @@ def create_visualizations(summary, features_df, labels_df, performance):
         axes[1, 1].set_title("전체 기간 이벤트 수")
         axes[1, 1].set_ylabel("이벤트 수")
 
-    plt.tight_layout()
-    plt.savefig("raw_data/training_visualization.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.tight_layout()
+    fig.savefig("raw_data/training_visualization.png", dpi=dpi)
+    plt.close(fig)
 
     # 2. 특성 중요도 시각화 (이미 생성된 파일 확인)
     print("✅ 시각화 생성 완료: raw_data/training_visualization.png")
@@ -138,6 +161,17 @@ def create_markdown_report(summary):
 
     best_model_name, best_model_score = summary["best_model"]
 
+    # 표 행은 리스트에 모았다가 한 번에 결합 (문자열 += 반복 시 매번 재할당)
+    model_rows = "".join(
+        f"| {model_name} | {scores['train_score']:.4f} | {scores['test_score']:.4f} |\n"
+        for model_name, scores in summary["model_performance"].items()
+    )
+    ticker_rows = "".join(
+        f"| {ticker} | {stats['records']} | {stats['major_events']} "
+        f"| {stats['event_rate']:.2%} |\n"
+        for ticker, stats in summary["ticker_statistics"].items()
+    )
+
     report = f"""# S&P500 이벤트 탐지 모델 학습 결과
 
 ## 학습 요약
@@ -162,12 +196,7 @@ def create_markdown_report(summary):
 ### 전체 모델 성능
 | 모델 | 훈련 정확도 | 테스트 정확도 |
 |------|-------------|---------------|
-"""
-
-    for model_name, scores in summary["model_performance"].items():
-        report += f"| {model_name} | {scores['train_score']:.4f} | {scores['test_score']:.4f} |\n"
-
-    report += f"""
+{model_rows}
 ### 🏆 최고 성능 모델
 **{best_model_name}** (테스트 정확도: {best_model_score['test_score']:.4f})
 
@@ -175,12 +204,7 @@ def create_markdown_report(summary):
 
 | 종목 | 레코드 수 | 이벤트 수 | 이벤트 비율 |
 |------|-----------|-----------|-------------|
-"""
-
-    for ticker, stats in summary["ticker_statistics"].items():
-        report += f"| {ticker} | {stats['records']} | {stats['major_events']} | {stats['event_rate']:.2%} |\n"
-
-    report += f"""
+{ticker_rows}
 ## 결과 파일
 
 - **모델 파일**: 
@@ -210,8 +234,9 @@ def create_markdown_report(summary):
 *Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
 
-    with open("raw_data/TRAINING_REPORT.md", "w") as f:
-        f.write(report)
+    # 인코딩한 바이트를 큰 버퍼로 한 번에 기록 (텍스트 모드 개행 변환 생략)
+    with open("raw_data/TRAINING_REPORT.md", "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(report.encode("utf-8"))
 
     print("✅ 마크다운 리포트 생성 완료: raw_data/TRAINING_REPORT.md")
 
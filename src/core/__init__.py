@@ -2,12 +2,30 @@
 Core system components
 """
 
-from .data_collection_pipeline import SP500DataCollector
-from .api_config import APIManager
-from .advanced_preprocessing import AdvancedPreprocessor
+import importlib
+
+# 하위 모듈은 실제로 접근할 때 import (패키지 import 시 pandas 등 무거운 의존성 로드 방지)
+_LAZY_IMPORTS = {
+    "SP500DataCollector": "data_collection_pipeline",
+    "APIManager": "api_config",
+    "AdvancedPreprocessor": "advanced_preprocessing",
+}
 
 __all__ = [
     "SP500DataCollector",
     "APIManager",
     "AdvancedPreprocessor",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # 이후 접근은 모듈 __dict__에서 바로 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -16,139 +16,397 @@ from sklearn.decomposition import PCA, FastICA, FactorAnalysis
 from sklearn.feature_selection import SelectKBest, RFE
 from sklearn.feature_selection import f_classif, mutual_info_classif
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LassoCV
-from sklearn.cluster import KMeans
+from sklearn.linear_model import LassoCV, LassoLarsIC
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.impute import SimpleImputer, KNNImputer
 from sklearn.pipeline import Pipeline
-from scipy import stats
+from scipy import fft as sfft
+from collections import OrderedDict
+import joblib
 import ta
 import warnings
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba 미설치 시 pandas rolling 사용
+    njit = prange = None
+
+try:
+    import numexpr
+except ImportError:  # numexpr 미설치 시 NumPy 연산 사용
+    numexpr = None
+
 warnings.filterwarnings("ignore")
 
+# 시차 특성 대상 열과 특성 이름 접두사
+LAG_FEATURE_COLUMNS = [
+    ("close", "close"),
+    ("volume", "volume"),
+    ("price_change", "return"),
+    ("rsi", "rsi"),
+]
+
+# 기술적 비율 계산에 사용하는 열
+TECHNICAL_RATIO_COLUMNS = (
+    "close",
+    "volume",
+    "high",
+    "low",
+    "open",
+    "sma_20",
+    "sma_50",
+    "bb_upper",
+    "bb_lower",
+)
+
+# 전처리 단계 결과 캐시 크기 (조합 간 공통 접두사 재사용용)
+# 항목 수와 함께 보관 중인 X의 총 바이트 수도 제한해 큰 입력에서 메모리가 불어나지 않게 함
+STEP_CACHE_SIZE = 16
+STEP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _rolling_stats_pandas(values, window):
+    rolling = pd.Series(values).rolling(window=window)
+    return np.column_stack(
+        [rolling.mean(), rolling.std(), rolling.min(), rolling.max()]
+    )
+
+
+def _rolling_stats_2d_pandas(values, window):
+    return np.stack(
+        [_rolling_stats_pandas(values[:, j], window) for j in range(values.shape[1])]
+    )
+
+
+def _rolling_moments_pandas(values, window):
+    rolling = pd.Series(values).rolling(window=window)
+    return np.column_stack(
+        [rolling.mean(), rolling.std(), rolling.skew(), rolling.kurt()]
+    )
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _rolling_moments_kernel(values, window):
+        # x, x^2, x^3, x^4 의 이동 합을 한 번의 순회로 갱신 (윈도우마다 재계산하지 않음)
+        n = values.shape[0]
+        out = np.full((n, 4), np.nan)
+        s1 = s2 = s3 = s4 = 0.0
+        n_nan = 0
+        for i in range(n):
+            x = values[i]
+            if np.isnan(x):
+                n_nan += 1
+            else:
+                x2 = x * x
+                s1 += x
+                s2 += x2
+                s3 += x2 * x
+                s4 += x2 * x2
+            if i >= window:
+                x = values[i - window]
+                if np.isnan(x):
+                    n_nan -= 1
+                else:
+                    x2 = x * x
+                    s1 -= x
+                    s2 -= x2
+                    s3 -= x2 * x
+                    s4 -= x2 * x2
+            # pandas와 동일하게 윈도우가 다 차지 않았거나 결측이 있으면 NaN
+            if i + 1 < window or n_nan > 0:
+                continue
+
+            nobs = float(window)
+            A = s1 / nobs
+            B = s2 / nobs - A * A
+            C = s3 / nobs - A * A * A - 3 * A * B
+            D = s4 / nobs - A * A * A * A - 6 * B * A * A - 4 * C * A
+            out[i, 0] = A
+            if window >= 2:
+                out[i, 1] = np.sqrt(max(B, 0.0) * nobs / (nobs - 1))
+            if B <= 1e-14:
+                continue
+            if window >= 3:
+                out[i, 2] = (
+                    np.sqrt(nobs * (nobs - 1)) * C / ((nobs - 2) * B * np.sqrt(B))
+                )
+            if window >= 4:
+                K = (nobs * nobs - 1) * D / (B * B) - 3 * (nobs - 1) ** 2
+                out[i, 3] = K / ((nobs - 2) * (nobs - 3))
+        return out
+
+    @njit(cache=True)
+    def _rolling_stats_kernel(values, window, shift):
+        # 이동 합(평균/표준편차)과 단조 덱(최소/최대)을 한 번의 순회로 갱신
+        n = values.shape[0]
+        out = np.full((n, 4), np.nan)
+        min_q = np.empty(n, np.int64)
+        max_q = np.empty(n, np.int64)
+        min_head = min_tail = max_head = max_tail = 0
+        s1 = s2 = 0.0
+        n_nan = 0
+        for i in range(n):
+            x = values[i]
+            if np.isnan(x):
+                n_nan += 1
+            else:
+                s1 += x - shift
+                s2 += (x - shift) * (x - shift)
+                while min_tail > min_head and values[min_q[min_tail - 1]] >= x:
+                    min_tail -= 1
+                min_q[min_tail] = i
+                min_tail += 1
+                while max_tail > max_head and values[max_q[max_tail - 1]] <= x:
+                    max_tail -= 1
+                max_q[max_tail] = i
+                max_tail += 1
+            if i >= window:
+                x = values[i - window]
+                if np.isnan(x):
+                    n_nan -= 1
+                else:
+                    s1 -= x - shift
+                    s2 -= (x - shift) * (x - shift)
+            start = i - window + 1
+            while min_head < min_tail and min_q[min_head] < start:
+                min_head += 1
+            while max_head < max_tail and max_q[max_head] < start:
+                max_head += 1
+            # pandas와 동일하게 윈도우가 다 차지 않았거나 결측이 있으면 NaN
+            if i + 1 < window or n_nan > 0:
+                continue
+
+            nobs = float(window)
+            mean = s1 / nobs
+            out[i, 0] = mean + shift
+            if window >= 2:
+                var = max(s2 / nobs - mean * mean, 0.0)
+                out[i, 1] = np.sqrt(var * nobs / (nobs - 1))
+            out[i, 2] = values[min_q[min_head]]
+            out[i, 3] = values[max_q[max_head]]
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _rolling_stats_2d_kernel(values, window, shifts):
+        # 열들은 서로 독립이므로 열 단위로 나눠 병렬 계산
+        n_rows, n_cols = values.shape
+        out = np.empty((n_cols, n_rows, 4))
+        for j in prange(n_cols):
+            out[j] = _rolling_stats_kernel(values[:, j], window, shifts[j])
+        return out
+
+    def _rolling_stats_2d(values, window):
+        """열마다 이동 평균/표준편차/최소/최대 ((열, 행, 통계) 배열, pandas rolling과 같은 정의)"""
+        values = np.asfortranarray(values, dtype=np.float64)
+        shifts = np.array(
+            [
+                np.nanmean(column) if np.isfinite(column).any() else 0.0
+                for column in values.T
+            ]
+        )
+        return _rolling_stats_2d_kernel(values, window, shifts)
+
+    def _rolling_moments(values, window):
+        """이동 평균/표준편차/왜도/첨도 (열 순서 동일, pandas rolling과 같은 정의)"""
+        # 거듭제곱 합의 상쇄 오차를 줄이기 위해 전체 평균을 빼고 계산한 뒤 평균만 복원
+        shift = np.nanmean(values) if np.isfinite(values).any() else 0.0
+        moments = _rolling_moments_kernel(values - shift, window)
+        moments[:, 0] += shift
+        return moments
+
+else:
+    _rolling_stats_2d = _rolling_stats_2d_pandas
+    _rolling_moments = _rolling_moments_pandas
+
+
+def _make_adapter(info):
+    """전처리 방법을 (X, y) -> (X', y') 형태의 호출 함수로 변환"""
+    method = info["method"]
+    kind = info["kind"]
+
+    if kind == "supervised_est":
+        fit_transform = method.fit_transform
+        return lambda X, y: (fit_transform(X, y), y)
+    if kind == "unsupervised_est":
+        fit_transform = method.fit_transform
+        return lambda X, y: (fit_transform(X), y)
+    if kind == "supervised_fn":
+        return lambda X, y: (method(X, y), y)
+    if kind == "sample_filter":
+        # 행을 제거하는 방법은 X와 y를 함께 반환
+        return method
+    return lambda X, y: (method(X), y)
+
 
 class AdvancedPreprocessor:
     def __init__(self):
         self.preprocessing_methods = self.define_preprocessing_methods()
+        # 방법 이름 -> (X, y) -> (X', y') 호출 함수 (적용할 때마다 종류를 다시 판별하지 않음)
+        self._dispatch = {
+            name: _make_adapter(info)
+            for name, info in self.preprocessing_methods.items()
+        }
+        # (입력 데이터 해시, 적용한 방법 접두사) -> (X, y) 결과 (LRU)
+        self._step_cache = OrderedDict()
+        self._step_cache_nbytes = 0
+        # 마지막으로 적합한 PCA (입력 데이터 해시, 모델)
+        self._pca_fit = (None, None)
+        # 마지막으로 계산한 백색화 결과 (입력 데이터 해시, 백색화된 X)
+        self._whitened = (None, None)
 
     def define_preprocessing_methods(self):
-        """고급 전처리 방법 정의"""
+        """고급 전처리 방법 정의
+
+        kind: supervised_est / unsupervised_est (sklearn 변환기, y 사용 여부),
+        supervised_fn / unsupervised_fn (커스텀 함수, y 사용 여부),
+        sample_filter (행을 제거하고 (X, y)를 반환하는 함수)
+        """
 
         return {
             # 1. 스케일링 방법
             "standard_scaling": {
                 "name": "Standard Scaling",
                 "method": StandardScaler(),
+                "kind": "unsupervised_est",
                 "description": "Mean 0, Standard deviation 1로 정규화",
             },
             "minmax_scaling": {
                 "name": "MinMax Scaling",
                 "method": MinMaxScaler(),
+                "kind": "unsupervised_est",
                 "description": "0-1 범위로 정규화",
             },
             "robust_scaling": {
                 "name": "Robust Scaling",
                 "method": RobustScaler(),
+                "kind": "unsupervised_est",
                 "description": "Median과 IQR 사용한 스케일링",
             },
             "power_transform": {
                 "name": "Power Transform (Yeo-Johnson)",
                 "method": PowerTransformer(method="yeo-johnson"),
+                "kind": "unsupervised_est",
                 "description": "Power transformation으로 정규분포에 가깝게 변환",
             },
             "quantile_transform": {
                 "name": "Quantile Transform",
                 "method": QuantileTransformer(output_distribution="normal"),
+                "kind": "unsupervised_est",
                 "description": "Quantile 기반 정규분포 변환",
             },
             # 2. 결측값 처리
             "simple_imputer_mean": {
                 "name": "Simple Imputer (Mean)",
                 "method": SimpleImputer(strategy="mean"),
+                "kind": "unsupervised_est",
                 "description": "평균값으로 결측값 대체",
             },
             "simple_imputer_median": {
                 "name": "Simple Imputer (Median)",
                 "method": SimpleImputer(strategy="median"),
+                "kind": "unsupervised_est",
                 "description": "중간값으로 결측값 대체",
             },
             "knn_imputer": {
                 "name": "KNN Imputer",
                 "method": KNNImputer(n_neighbors=5),
+                "kind": "unsupervised_est",
                 "description": "K-최근접 이웃 기반 결측값 대체",
             },
             # 3. 이상치 처리
             "outlier_clip": {
                 "name": "Outlier Clipping",
                 "method": self.clip_outliers,
+                "kind": "unsupervised_fn",
                 "description": "IQR 기반 이상치 클리핑",
             },
             "outlier_zscore": {
                 "name": "Z-Score Outlier Removal",
                 "method": self.remove_zscore_outliers,
+                "kind": "sample_filter",
                 "description": "Z-Score 기반 이상치 제거",
             },
             "outlier_isolation": {
                 "name": "Isolation Forest",
                 "method": self.remove_isolation_outliers,
+                "kind": "sample_filter",
                 "description": "Isolation Forest 기반 이상치 제거",
             },
             # 4. 특성 생성
             "polynomial_features": {
                 "name": "Polynomial Features",
                 "method": self.create_polynomial_features,
+                "kind": "unsupervised_fn",
                 "description": "다항식 특성 생성",
             },
             "interaction_features": {
                 "name": "Interaction Features",
                 "method": self.create_interaction_features,
+                "kind": "unsupervised_fn",
                 "description": "특성 간 상호작용 특성 생성",
             },
             "technical_ratios": {
                 "name": "Technical Ratios",
                 "method": self.create_technical_ratios,
+                "kind": "unsupervised_fn",
                 "description": "기술적 비율 특성 생성",
             },
             "rolling_features": {
                 "name": "Rolling Features",
                 "method": self.create_rolling_features,
+                "kind": "unsupervised_fn",
                 "description": "이동 윈도우 통계 특성 생성",
             },
             "lag_features": {
                 "name": "Lag Features",
                 "method": self.create_lag_features,
+                "kind": "unsupervised_fn",
                 "description": "시차 특성 생성",
             },
             "fourier_features": {
                 "name": "Fourier Transform Features",
                 "method": self.create_fourier_features,
+                "kind": "unsupervised_fn",
                 "description": "FFT 기반 주파수 도메인 특성",
             },
             # 5. 차원 축소
             "pca": {
                 "name": "Principal Component Analysis",
-                "method": PCA(n_components=0.95),
+                "method": self.pca_transform,
+                "kind": "unsupervised_fn",
                 "description": "주성분 분석 (95% 분산 유지)",
             },
+            "whitened": {
+                "name": "PCA Whitening",
+                "method": self.whiten_transform,
+                "kind": "unsupervised_fn",
+                "description": "PCA 백색화 (ICA와 결과 공유)",
+            },
             "ica": {
                 "name": "Independent Component Analysis",
-                "method": FastICA(n_components=20, random_state=42),
+                "method": self.ica_transform,
+                "kind": "unsupervised_fn",
                 "description": "독립성분 분석",
             },
             "factor_analysis": {
                 "name": "Factor Analysis",
                 "method": FactorAnalysis(n_components=20, random_state=42),
+                "kind": "unsupervised_est",
                 "description": "요인 분석",
             },
             # 6. 특성 선택
             "univariate_selection": {
                 "name": "Univariate Feature Selection",
                 "method": SelectKBest(score_func=f_classif, k=20),
+                "kind": "supervised_est",
                 "description": "단변량 통계 테스트 기반 특성 선택",
             },
             "mutual_info_selection": {
                 "name": "Mutual Information Selection",
                 "method": SelectKBest(score_func=mutual_info_classif, k=20),
+                "kind": "supervised_est",
                 "description": "상호정보량 기반 특성 선택",
             },
             "rfe_selection": {
@@ -157,51 +415,91 @@ class AdvancedPreprocessor:
                     RandomForestClassifier(n_estimators=100, random_state=42),
                     n_features_to_select=20,
                 ),
+                "kind": "supervised_est",
                 "description": "재귀적 특성 제거",
             },
             "lasso_selection": {
                 "name": "Lasso Feature Selection",
                 "method": self.lasso_feature_selection,
+                "kind": "supervised_fn",
                 "description": "Lasso 정규화 기반 특성 선택",
             },
             # 7. 클러스터링 기반 특성
             "kmeans_features": {
                 "name": "K-Means Clustering Features",
                 "method": self.create_kmeans_features,
+                "kind": "unsupervised_fn",
                 "description": "K-Means 클러스터링 기반 특성",
             },
             # 8. 시계열 특성
             "technical_indicators_extended": {
                 "name": "Extended Technical Indicators",
                 "method": self.create_extended_technical_indicators,
+                "kind": "unsupervised_fn",
                 "description": "확장된 기술적 지표",
             },
             "cyclical_features": {
                 "name": "Cyclical Features",
                 "method": self.create_cyclical_features,
+                "kind": "unsupervised_fn",
                 "description": "시간 기반 순환 특성",
             },
         }
 
     def clip_outliers(self, X):
         """IQR 기반 이상치 클리핑"""
-        X_clipped = X.copy()
-
-        for i in range(X.shape[1]):
-            Q1 = np.percentile(X[:, i], 25)
-            Q3 = np.percentile(X[:, i], 75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-
-            X_clipped[:, i] = np.clip(X[:, i], lower_bound, upper_bound)
+        # 모든 열의 사분위수를 한 번에 계산하고 경계는 브로드캐스트로 적용
+        Q1, Q3 = np.percentile(X, [25, 75], axis=0)
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+
+        return np.clip(X, lower_bound, upper_bound)
+
+    def pca_transform(self, X):
+        """주성분 분석 (95% 분산 유지, 같은 입력이면 적합 결과 재사용)"""
+        key = joblib.hash(X)
+        cached_key, pca = self._pca_fit
+        if cached_key != key:
+            # 분산 비율로 성분 수를 정하므로 전체 SVD 사용 (randomized는 정수 성분 수만 지원)
+            pca = PCA(n_components=0.95, svd_solver="full").fit(X)
+            self._pca_fit = (key, pca)
+        return pca.transform(X)
+
+    def whiten_transform(self, X, n_components=20):
+        """PCA 백색화 (같은 입력이면 이전 결과 재사용)"""
+        cached_key, X_white = self._whitened
+        if X is X_white:
+            return X  # 'whitened' 다음에 'ica'가 오는 경우 이미 백색화된 입력
+        key = joblib.hash((X, n_components))
+        if cached_key != key:
+            pca = PCA(
+                n_components=min(n_components, *X.shape),
+                whiten=True,
+                svd_solver="randomized",
+                random_state=42,
+            )
+            X_white = pca.fit_transform(X)
+            self._whitened = (key, X_white)
+        return X_white
 
-        return X_clipped
+    def ica_transform(self, X, n_components=20):
+        """독립성분 분석 (백색화는 whiten_transform 결과를 공유)"""
+        # 이미 백색화된 입력이므로 FastICA 내부의 백색화 SVD는 생략
+        ica = FastICA(whiten=False, random_state=42)
+        return ica.fit_transform(self.whiten_transform(X, n_components))
 
     def remove_zscore_outliers(self, X, y=None, threshold=3):
         """Z-Score 기반 이상치 제거"""
-        z_scores = np.abs(stats.zscore(X))
-        outlier_mask = (z_scores < threshold).all(axis=1)
+        # 마스크만 필요하므로 float32로 계산하고 임시 배열은 하나만 사용
+        X32 = np.asarray(X, dtype=np.float32)
+        mu = X32.mean(axis=0, keepdims=True)
+        sd = X32.std(axis=0, keepdims=True)
+        sd[sd == 0] = 1  # 상수 열은 이상치 판정에서 제외
+
+        deviation = np.subtract(X32, mu)
+        np.abs(deviation, out=deviation)
+        outlier_mask = (deviation < threshold * sd).all(axis=1)
 
         if y is not None:
             return X[outlier_mask], y[outlier_mask]
@@ -212,7 +510,14 @@ class AdvancedPreprocessor:
         """Isolation Forest 기반 이상치 제거"""
         from sklearn.ensemble import IsolationForest
 
-        iso_forest = IsolationForest(contamination=contamination, random_state=42)
+        # 트리마다 256개 표본만 학습하고 트리 적합/점수 계산은 모든 코어에서 병렬 수행
+        iso_forest = IsolationForest(
+            n_estimators=100,
+            max_samples=min(256, X.shape[0]),
+            contamination=contamination,
+            n_jobs=-1,
+            random_state=42,
+        )
         outlier_mask = iso_forest.fit_predict(X) == 1
 
         if y is not None:
@@ -230,6 +535,13 @@ class AdvancedPreprocessor:
         else:
             X_selected = X
 
+        if degree == 2:
+            # 2차는 i <= j 상삼각 쌍의 곱 (PolynomialFeatures와 같은 열 순서)
+            i, j = np.triu_indices(X_selected.shape[1])
+            return np.concatenate(
+                [X_selected, X_selected[:, i] * X_selected[:, j]], axis=1
+            )
+
         poly = PolynomialFeatures(degree=degree, include_bias=False)
         X_poly = poly.fit_transform(X_selected)
 
@@ -246,140 +558,148 @@ class AdvancedPreprocessor:
         else:
             X_selected = X
 
-        interaction_features = []
-
-        # 2차 상호작용
-        for i in range(n_features):
-            for j in range(i + 1, n_features):
-                interaction_features.append(X_selected[:, i] * X_selected[:, j])
-
-        if interaction_features:
-            X_interactions = np.column_stack([X] + interaction_features)
-        else:
-            X_interactions = X
+        # 2차 상호작용: 상삼각 인덱스 쌍으로 모든 곱을 한 번에 계산
+        i, j = np.triu_indices(n_features, k=1)
+        if len(i) == 0:
+            return X
 
-        return X_interactions
+        return np.concatenate([X, X_selected[:, i] * X_selected[:, j]], axis=1)
 
     def create_technical_ratios(self, df):
         """기술적 비율 특성 생성"""
+        # 필요한 열만 한 번 ndarray로 꺼내 두고 비율은 NumPy로 계산 (Series 정렬/할당 생략)
+        cols = {
+            column: df[column].to_numpy(dtype=np.float64)
+            for column in TECHNICAL_RATIO_COLUMNS
+            if column in df.columns
+        }
         ratios = {}
 
-        if "close" in df.columns and "volume" in df.columns:
-            ratios["price_volume_ratio"] = df["close"] / (df["volume"] + 1e-8)
+        if "close" in cols and "volume" in cols:
+            ratios["price_volume_ratio"] = cols["close"] / (cols["volume"] + 1e-8)
 
-        if "high" in df.columns and "low" in df.columns:
-            ratios["high_low_ratio"] = df["high"] / (df["low"] + 1e-8)
+        if "high" in cols and "low" in cols:
+            ratios["high_low_ratio"] = cols["high"] / (cols["low"] + 1e-8)
 
-        if "close" in df.columns and "open" in df.columns:
-            ratios["close_open_ratio"] = df["close"] / (df["open"] + 1e-8)
+        if "close" in cols and "open" in cols:
+            ratios["close_open_ratio"] = cols["close"] / (cols["open"] + 1e-8)
 
-        if "sma_20" in df.columns and "sma_50" in df.columns:
-            ratios["sma_ratio"] = df["sma_20"] / (df["sma_50"] + 1e-8)
+        if "sma_20" in cols and "sma_50" in cols:
+            ratios["sma_ratio"] = cols["sma_20"] / (cols["sma_50"] + 1e-8)
 
-        if "bb_upper" in df.columns and "bb_lower" in df.columns:
-            ratios["bb_width"] = (df["bb_upper"] - df["bb_lower"]) / (
-                df["bb_lower"] + 1e-8
-            )
+        # 복합식은 numexpr로 한 번에 계산 (중간 배열 없이 한 번의 순회)
+        if "bb_upper" in cols and "bb_lower" in cols:
+            if numexpr is not None:
+                ratios["bb_width"] = pd.eval(
+                    "(bb_upper - bb_lower) / (bb_lower + 1e-8)",
+                    local_dict=cols,
+                    engine="numexpr",
+                )
+            else:
+                ratios["bb_width"] = (cols["bb_upper"] - cols["bb_lower"]) / (
+                    cols["bb_lower"] + 1e-8
+                )
 
-        if (
-            "close" in df.columns
-            and "bb_upper" in df.columns
-            and "bb_lower" in df.columns
-        ):
-            ratios["bb_position"] = (df["close"] - df["bb_lower"]) / (
-                df["bb_upper"] - df["bb_lower"] + 1e-8
-            )
+        if "close" in cols and "bb_upper" in cols and "bb_lower" in cols:
+            if numexpr is not None:
+                ratios["bb_position"] = pd.eval(
+                    "(close - bb_lower) / (bb_upper - bb_lower + 1e-8)",
+                    local_dict=cols,
+                    engine="numexpr",
+                )
+            else:
+                ratios["bb_position"] = (cols["close"] - cols["bb_lower"]) / (
+                    cols["bb_upper"] - cols["bb_lower"] + 1e-8
+                )
 
-        return pd.DataFrame(ratios)
+        return pd.DataFrame(ratios, index=df.index)
 
     def create_rolling_features(self, df, windows=[5, 10, 20]):
         """이동 윈도우 통계 특성 생성"""
         rolling_features = {}
 
+        # 가격/거래량 열은 열 우선 배열로 한 번 묶어 윈도우마다 한 번의 커널 호출로 처리
+        stat_columns = [
+            column for column in ("close", "volume") if column in df.columns
+        ]
+        if stat_columns:
+            stat_values = np.asfortranarray(df[stat_columns].to_numpy(dtype=np.float64))
+
         for window in windows:
-            if "close" in df.columns:
-                rolling_features[f"close_mean_{window}"] = (
-                    df["close"].rolling(window=window).mean()
-                )
-                rolling_features[f"close_std_{window}"] = (
-                    df["close"].rolling(window=window).std()
-                )
-                rolling_features[f"close_min_{window}"] = (
-                    df["close"].rolling(window=window).min()
-                )
-                rolling_features[f"close_max_{window}"] = (
-                    df["close"].rolling(window=window).max()
-                )
+            # 평균/표준편차/최소/최대는 열마다 한 번의 순회로 함께 계산
+            stats = {}
+            if stat_columns:
+                stats = dict(zip(stat_columns, _rolling_stats_2d(stat_values, window)))
 
-            if "volume" in df.columns:
-                rolling_features[f"volume_mean_{window}"] = (
-                    df["volume"].rolling(window=window).mean()
-                )
-                rolling_features[f"volume_std_{window}"] = (
-                    df["volume"].rolling(window=window).std()
-                )
+            if "close" in stats:
+                for j, stat in enumerate(("mean", "std", "min", "max")):
+                    rolling_features[f"close_{stat}_{window}"] = stats["close"][:, j]
+
+            if "volume" in stats:
+                rolling_features[f"volume_mean_{window}"] = stats["volume"][:, 0]
+                rolling_features[f"volume_std_{window}"] = stats["volume"][:, 1]
 
             if "price_change" in df.columns:
-                rolling_features[f"return_mean_{window}"] = (
-                    df["price_change"].rolling(window=window).mean()
-                )
-                rolling_features[f"return_std_{window}"] = (
-                    df["price_change"].rolling(window=window).std()
-                )
-                rolling_features[f"return_skew_{window}"] = (
-                    df["price_change"].rolling(window=window).skew()
-                )
-                rolling_features[f"return_kurt_{window}"] = (
-                    df["price_change"].rolling(window=window).kurt()
+                # 수익률의 네 가지 적률은 한 번의 순회로 함께 계산
+                moments = _rolling_moments(
+                    df["price_change"].to_numpy(dtype=np.float64), window
                 )
+                for j, stat in enumerate(("mean", "std", "skew", "kurt")):
+                    rolling_features[f"return_{stat}_{window}"] = moments[:, j]
 
-        return pd.DataFrame(rolling_features)
+        return pd.DataFrame(rolling_features, index=df.index)
 
     def create_lag_features(self, df, lags=[1, 3, 5, 10]):
         """시차 특성 생성"""
-        lag_features = {}
-
-        for lag in lags:
-            if "close" in df.columns:
-                lag_features[f"close_lag_{lag}"] = df["close"].shift(lag)
-
-            if "volume" in df.columns:
-                lag_features[f"volume_lag_{lag}"] = df["volume"].shift(lag)
-
-            if "price_change" in df.columns:
-                lag_features[f"return_lag_{lag}"] = df["price_change"].shift(lag)
-
-            if "rsi" in df.columns:
-                lag_features[f"rsi_lag_{lag}"] = df["rsi"].shift(lag)
-
-        return pd.DataFrame(lag_features)
+        lag_columns = [
+            (column, prefix)
+            for column, prefix in LAG_FEATURE_COLUMNS
+            if column in df.columns
+        ]
+        if not lag_columns:
+            return pd.DataFrame()
+
+        # 시차별 shift로 Series를 매번 만들지 않고 하나의 버퍼에 슬라이스로 기록
+        values = df[[column for column, _ in lag_columns]].to_numpy(dtype=np.float64)
+        n_rows, n_cols = values.shape
+        lagged = np.full((n_rows, n_cols * len(lags)), np.nan)
+        names = []
+
+        for i, lag in enumerate(lags):
+            if lag < n_rows:
+                lagged[lag:, i * n_cols : (i + 1) * n_cols] = values[: n_rows - lag]
+            names.extend(f"{prefix}_lag_{lag}" for _, prefix in lag_columns)
+
+        return pd.DataFrame(lagged, index=df.index, columns=names)
 
     def create_fourier_features(self, X, n_components=5):
         """FFT 기반 주파수 도메인 특성"""
-        fourier_features = []
-
-        for i in range(min(n_components, X.shape[1])):
-            # FFT 계산
-            fft_values = np.fft.fft(X[:, i])
+        n_components = min(n_components, X.shape[1])
+        if n_components == 0:
+            return X
 
-            # 주파수 성분 추출
-            fourier_features.append(np.real(fft_values[: len(fft_values) // 2]))
-            fourier_features.append(np.imag(fft_values[: len(fft_values) // 2]))
+        # 실수 입력이므로 rfft로 양의 주파수 성분만 모든 열에 대해 한 번에 계산
+        # (scipy.fft는 열별 변환을 모든 코어에 나눠 수행)
+        n_samples = X.shape[0]
+        n_freqs = n_samples // 2
+        spectrum = sfft.rfft(X[:, :n_components], axis=0, workers=-1)[:n_freqs]
 
-        if fourier_features:
-            # 모든 시리즈 길이를 맞춤
-            min_length = min(len(f) for f in fourier_features)
-            fourier_features = [f[:min_length] for f in fourier_features]
-
-            X_fourier = np.column_stack([X] + fourier_features)
-        else:
-            X_fourier = X
+        # 주파수 성분(실수부, 허수부)을 행 수에 맞춰 배치 (나머지 행은 0)
+        fourier = np.zeros((n_samples, 2 * n_components))
+        fourier[:n_freqs, 0::2] = spectrum.real
+        fourier[:n_freqs, 1::2] = spectrum.imag
 
-        return X_fourier
+        return np.concatenate([X, fourier], axis=1)
 
     def lasso_feature_selection(self, X, y):
         """Lasso 정규화 기반 특성 선택"""
-        lasso = LassoCV(cv=5, random_state=42)
+        # 교차검증 없이 LARS 경로 한 번으로 BIC 최소 지점의 계수를 선택
+        # BIC의 잡음 분산 추정에는 샘플 수 > 특성 수 + 절편이 필요하므로,
+        # 다항/상호작용 확장으로 특성이 더 많아지면 교차검증 Lasso로 대체
+        if X.shape[0] > X.shape[1] + 1:
+            lasso = LassoLarsIC(criterion="bic")
+        else:
+            lasso = LassoCV(cv=5, random_state=42)
         lasso.fit(X, y)
 
         selected_features = np.where(lasso.coef_ != 0)[0]
@@ -391,11 +711,14 @@ class AdvancedPreprocessor:
 
     def create_kmeans_features(self, X, n_clusters=5):
         """K-Means 클러스터링 기반 특성"""
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-        cluster_labels = kmeans.fit_predict(X)
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_clusters, batch_size=1024, n_init=3, random_state=42
+        )
+        kmeans.fit(X)
 
-        # 클러스터 중심까지의 거리
+        # 클러스터 중심까지의 거리 (라벨은 가장 가까운 중심이므로 거리에서 바로 구함)
         distances = kmeans.transform(X)
+        cluster_labels = distances.argmin(axis=1)
 
         # 클러스터 라벨과 거리를 특성으로 추가
         cluster_features = np.column_stack(
@@ -451,25 +774,31 @@ class AdvancedPreprocessor:
 
     def create_cyclical_features(self, df):
         """시간 기반 순환 특성"""
-        cyclical_features = {}
-
-        if "date" in df.columns:
-            dates = pd.to_datetime(df["date"])
-
-            # 시간 기반 순환 특성
-            cyclical_features["hour_sin"] = np.sin(2 * np.pi * dates.dt.hour / 24)
-            cyclical_features["hour_cos"] = np.cos(2 * np.pi * dates.dt.hour / 24)
-
-            cyclical_features["day_sin"] = np.sin(2 * np.pi * dates.dt.dayofweek / 7)
-            cyclical_features["day_cos"] = np.cos(2 * np.pi * dates.dt.dayofweek / 7)
-
-            cyclical_features["month_sin"] = np.sin(2 * np.pi * dates.dt.month / 12)
-            cyclical_features["month_cos"] = np.cos(2 * np.pi * dates.dt.month / 12)
+        if "date" not in df.columns:
+            return pd.DataFrame()
+
+        dates = pd.to_datetime(df["date"]).dt
+        periods = (("hour", 24), ("day", 7), ("month", 12), ("quarter", 4))
+
+        # 네 주기의 각도를 (4, N) 배열로 쌓아 sin/cos를 각각 한 번만 계산
+        angles = np.stack(
+            [
+                dates.hour.to_numpy(dtype=np.float64),
+                dates.dayofweek.to_numpy(dtype=np.float64),
+                dates.month.to_numpy(dtype=np.float64),
+                dates.quarter.to_numpy(dtype=np.float64),
+            ]
+        )
+        angles *= (2 * np.pi / np.array([period for _, period in periods]))[:, None]
+        sin_all = np.sin(angles)
+        cos_all = np.cos(angles)
 
-            cyclical_features["quarter_sin"] = np.sin(2 * np.pi * dates.dt.quarter / 4)
-            cyclical_features["quarter_cos"] = np.cos(2 * np.pi * dates.dt.quarter / 4)
+        cyclical_features = {}
+        for k, (name, _) in enumerate(periods):
+            cyclical_features[f"{name}_sin"] = sin_all[k]
+            cyclical_features[f"{name}_cos"] = cos_all[k]
 
-        return pd.DataFrame(cyclical_features)
+        return pd.DataFrame(cyclical_features, index=df.index)
 
     def create_preprocessing_pipeline(self, methods_list):
         """전처리 파이프라인 생성"""
@@ -486,40 +815,60 @@ class AdvancedPreprocessor:
     def apply_preprocessing_combination(self, X, y, method_names):
         """전처리 조합 적용"""
 
-        X_processed = X.copy()
-        y_processed = y.copy()
+        # 열 단위로 동작하는 변환기가 많으므로 열 우선(Fortran) float32 배열로 시작
+        # (float32로 변환해 변환기들이 읽고 쓰는 메모리 양을 절반으로)
+        # 모든 방법이 새 배열을 반환하므로 입력이 이미 같은 형식이면 복사하지 않음
+        X_processed = np.asarray(X, dtype=np.float32, order="F")
+        y_processed = y
 
         applied_methods = []
+        # 같은 데이터에 같은 접두사의 방법들을 적용한 결과는 조합이 달라도 재사용
+        input_key = joblib.hash((X, y))
 
         for method_name in method_names:
-            if method_name in self.preprocessing_methods:
-                method = self.preprocessing_methods[method_name]["method"]
+            apply_method = self._dispatch.get(method_name)
+            if apply_method is not None:
+                cache_key = (input_key, *applied_methods, method_name)
+                cached = self._step_cache.get(cache_key)
+                if cached is not None:
+                    self._step_cache.move_to_end(cache_key)
+                    X_processed, y_processed = cached
+                    applied_methods.append(method_name)
+                    continue
 
                 try:
-                    if hasattr(method, "fit_transform"):
-                        if method_name in ["lasso_selection", "rfe_selection"]:
-                            # 지도학습 기반 방법
-                            X_processed = method.fit_transform(X_processed, y_processed)
-                        else:
-                            X_processed = method.fit_transform(X_processed)
-                    elif callable(method):
-                        # 커스텀 함수
-                        if method_name in [
-                            "remove_zscore_outliers",
-                            "remove_isolation_outliers",
-                        ]:
-                            X_processed, y_processed = method(X_processed, y_processed)
-                        else:
-                            X_processed = method(X_processed)
+                    X_processed, y_processed = apply_method(X_processed, y_processed)
 
                     applied_methods.append(method_name)
+                    self._cache_step(cache_key, X_processed, y_processed)
 
                 except Exception as e:
                     print(f"전처리 방법 {method_name} 적용 실패: {e}")
                     continue
 
+        # 캐시에 보관 중인 배열을 그대로 넘기면 호출자가 결과를 수정할 때 캐시가 오염되므로 복사본 반환
+        if applied_methods:
+            X_processed = X_processed.copy()
+            if y_processed is not y and y_processed is not None:
+                y_processed = y_processed.copy()
+
         return X_processed, y_processed, applied_methods
 
+    def _cache_step(self, cache_key, X_processed, y_processed):
+        """단계 결과를 LRU 캐시에 저장 (항목 수와 총 바이트 수 한도를 넘으면 오래된 것부터 제거)"""
+        nbytes = X_processed.nbytes
+        if nbytes > STEP_CACHE_MAX_BYTES:
+            return
+
+        self._step_cache[cache_key] = (X_processed, y_processed)
+        self._step_cache_nbytes += nbytes
+        while (
+            len(self._step_cache) > STEP_CACHE_SIZE
+            or self._step_cache_nbytes > STEP_CACHE_MAX_BYTES
+        ):
+            _, (X_evicted, _) = self._step_cache.popitem(last=False)
+            self._step_cache_nbytes -= X_evicted.nbytes
+
     def get_preprocessing_combinations(self):
         """전처리 조합 추천"""
 
@@ -1,14 +1,77 @@
+import functools
+import itertools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import yfinance as yf
 from textblob import TextBlob
 import logging
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # lxml 미설치 시 feedparser/BeautifulSoup으로 파싱
+    etree = lxml_html = None
+
+from src.utils.cache import FileCache, cached
+
+# HTTP 연결 풀 크기와 (연결, 읽기) 타임아웃(초)
+HTTP_POOL_SIZE = 32
+HTTP_TIMEOUT = (3, 10)
+
+# API 응답 캐시 유효 기간(초): 뉴스 15분, 일봉 이상 시세 24시간, 분/시간봉과 현재가 1분
+NEWS_CACHE_TTL = 15 * 60
+HISTORY_CACHE_TTL = 24 * 60 * 60
+INTRADAY_CACHE_TTL = 60
+
+# 다중 종목 뉴스 요청 한 번에 묶는 종목 수와 묶음당 최대 페이지 수
+NEWS_BATCH_SIZE = 15
+NEWS_BATCH_MAX_PAGES = 5
+
+
+def _yfinance_cache_ttl(ticker, period="1d", interval="1m"):
+    return INTRADAY_CACHE_TTL if interval[-1] in "mh" else HISTORY_CACHE_TTL
+
+
+@functools.lru_cache(maxsize=8192)
+def textblob_polarity(text):
+    """
+    TextBlob 감성 극성 (같은 헤드라인이 여러 종목/실행에서 반복되므로 결과를 캐시)
+    """
+    return TextBlob(text).sentiment.polarity
+
+
+def _textblob_sentiment(texts):
+    """
+    TextBlob 극성과 감성 라벨 (> 0.1 positive, < -0.1 negative, 그 외 neutral)
+    """
+    polarities = np.fromiter(
+        (textblob_polarity(text) for text in texts),
+        dtype=np.float64,
+        count=len(texts),
+    )
+    # 기사마다 분기하지 않고 배열 비교로 라벨을 한 번에 결정
+    labels = np.select(
+        [polarities > 0.1, polarities < -0.1],
+        ["positive", "negative"],
+        default="neutral",
+    )
+    return polarities.tolist(), labels.tolist()
+
+
+def _polygon_cache_ttl(ticker, multiplier=1, timespan="day", *args, **kwargs):
+    if timespan in ("second", "minute", "hour"):
+        return INTRADAY_CACHE_TTL
+    return HISTORY_CACHE_TTL
+
 
 class APIManager:
-    def __init__(self):
+    def __init__(self, cache_dir=".cache/api"):
         self.apis = {
             "news": {
                 "primary": "yahoo_rss",
@@ -44,13 +107,30 @@ class APIManager:
 
         self.logger = logging.getLogger(__name__)
 
+        # 요청마다 TCP/TLS 연결을 새로 맺지 않도록 연결 풀을 가진 세션을 재사용
+        self.session = requests.Session()
+        retry = Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # 같은 요청의 응답은 TTL 동안 디스크 캐시에서 재사용 (cache_dir=None이면 사용 안 함)
+        self.cache = FileCache(cache_dir) if cache_dir else None
+
+    @cached(endpoint="news_marketaux", ttl=NEWS_CACHE_TTL)
     def get_news_data_marketaux(self, ticker, limit=10):
         """Marketaux API를 통한 뉴스 데이터 수집"""
         try:
             api_key = self.apis["sp500_data"]["MARKETAUX"]["api_key"]
             url = f"{self.apis['sp500_data']['MARKETAUX']['base_url']}/news/all?symbols={ticker}&filter_entities=true&language=en&api_token={api_key}"
 
-            response = requests.get(url)
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
             if not response.ok:
                 self.logger.error(
                     f"Marketaux API request failed with status {response.status_code}: {response.text}"
@@ -66,40 +146,16 @@ class APIManager:
             )  # Log parsed JSON data
 
             if data.get("meta", {}).get("found", 0) > 0:
-                news_data = []
+                articles = []
                 for article in data.get("data", [])[:limit]:
                     if not isinstance(article, dict):
                         self.logger.warning(
                             f"Marketaux API: Expected dict for article, got {type(article)}: {article}"
                         )
                         continue
+                    articles.append(article)
 
-                    title = article.get("title", "")
-                    description = article.get("description", "")
-                    full_text = f"{title} {description}"
-
-                    blob = TextBlob(full_text)
-                    sentiment = blob.sentiment.polarity
-
-                    news_data.append(
-                        {
-                            "ticker": ticker,
-                            "title": title,
-                            "description": description,
-                            "url": article.get("url", ""),
-                            "publishedAt": article.get("published_at", ""),
-                            "source": article.get("source", {}).get("name", "Unknown"),
-                            "sentiment_label": (
-                                "positive"
-                                if sentiment > 0.1
-                                else "negative" if sentiment < -0.1 else "neutral"
-                            ),
-                            "sentiment_score": abs(sentiment),
-                            "polarity": sentiment,
-                            "text_length": len(full_text),
-                        }
-                    )
-                return news_data
+                return self._marketaux_news_records(ticker, articles)
         except json.JSONDecodeError as e:
             self.logger.error(
                 f"Marketaux 뉴스 수집 실패: JSON 디코딩 오류 - {e}. 전체 응답: {response.text}"
@@ -108,40 +164,171 @@ class APIManager:
             self.logger.error(f"Marketaux 뉴스 수집 실패: {e}")
         return []
 
+    @cached(endpoint="news_marketaux_batch", ttl=NEWS_CACHE_TTL)
+    def get_news_data_marketaux_batch(self, tickers, limit=10):
+        """
+        Marketaux API를 통한 다중 종목 뉴스 데이터 수집
+
+        종목을 NEWS_BATCH_SIZE개씩 묶어 요청하고, 기사는 응답의 종목
+        엔티티(없으면 제목/설명에 나온 티커)로 각 종목에 배정합니다.
+        종목별 결과는 get_news_data_marketaux와 같은 형식입니다.
+        요청이 실패한 묶음의 종목은 결과에서 빠지며, 기사를 하나도 받지 못하면
+        빈 dict를 반환해 실패한 응답이 캐시되지 않게 합니다.
+        """
+        news_by_ticker = {}
+
+        for start in range(0, len(tickers), NEWS_BATCH_SIZE):
+            chunk = tickers[start : start + NEWS_BATCH_SIZE]
+            articles_by_ticker = self._marketaux_batch_articles(chunk, limit)
+            if articles_by_ticker is None:
+                continue
+
+            for ticker, articles in articles_by_ticker.items():
+                try:
+                    news_by_ticker[ticker] = self._marketaux_news_records(
+                        ticker, articles
+                    )
+                except Exception as e:
+                    self.logger.error(f"Marketaux 뉴스 처리 실패 ({ticker}): {e}")
+                    news_by_ticker[ticker] = []
+
+        if not any(news_by_ticker.values()):
+            return {}
+        return news_by_ticker
+
+    def _marketaux_batch_articles(self, chunk, limit):
+        """
+        한 묶음의 종목 기사를 종목당 limit개까지 모음 (첫 요청이 실패하면 None)
+
+        묶음 전체가 한 페이지를 나눠 쓰지 않도록 limit * 종목 수만큼 요청하고,
+        요금제 한도로 페이지가 잘리면 NEWS_BATCH_MAX_PAGES까지 다음 페이지를 받습니다.
+        """
+        api_key = self.apis["sp500_data"]["MARKETAUX"]["api_key"]
+        base_url = self.apis["sp500_data"]["MARKETAUX"]["base_url"]
+        chunk_symbols = set(chunk)
+        symbol_pattern = re.compile(r"\b(" + "|".join(map(re.escape, chunk)) + r")\b")
+        articles_by_ticker = {ticker: [] for ticker in chunk}
+
+        for page in range(1, NEWS_BATCH_MAX_PAGES + 1):
+            url = f"{base_url}/news/all?symbols={','.join(chunk)}&filter_entities=true&language=en&limit={limit * len(chunk)}&page={page}&api_token={api_key}"
+            try:
+                response = self.session.get(url, timeout=HTTP_TIMEOUT)
+                if not response.ok:
+                    self.logger.error(
+                        f"Marketaux API request failed with status {response.status_code}: {response.text}"
+                    )
+                    return None if page == 1 else articles_by_ticker
+                data = response.json()
+            except Exception as e:
+                self.logger.error(f"Marketaux 다중 종목 뉴스 수집 실패: {e}")
+                return None if page == 1 else articles_by_ticker
+
+            articles = data.get("data") or []
+            for article in articles:
+                if not isinstance(article, dict):
+                    continue
+                symbols = {
+                    entity.get("symbol")
+                    for entity in article.get("entities") or []
+                    if isinstance(entity, dict)
+                } & chunk_symbols
+                if not symbols:
+                    title = article.get("title") or ""
+                    description = article.get("description") or ""
+                    symbols = set(symbol_pattern.findall(f"{title} {description}"))
+                for ticker in symbols:
+                    if len(articles_by_ticker[ticker]) < limit:
+                        articles_by_ticker[ticker].append(article)
+
+            # 모든 종목이 다 찼거나 마지막 페이지면 중단 (meta.limit은 실제 적용된 페이지 크기)
+            meta = data.get("meta") or {}
+            page_size = meta.get("limit") or len(articles)
+            if (
+                not articles
+                or len(articles) < page_size
+                or page * page_size >= meta.get("found", 0)
+                or all(len(found) >= limit for found in articles_by_ticker.values())
+            ):
+                break
+
+        return articles_by_ticker
+
+    def _marketaux_news_records(self, ticker, articles):
+        """Marketaux 기사 목록을 감성 분석 결과가 포함된 뉴스 레코드로 변환"""
+        full_texts = [
+            f"{article.get('title', '')} {article.get('description', '')}"
+            for article in articles
+        ]
+        polarities, labels = _textblob_sentiment(full_texts)
+
+        news_data = []
+        for article, full_text, sentiment, sentiment_label in zip(
+            articles, full_texts, polarities, labels
+        ):
+            news_data.append(
+                {
+                    "ticker": ticker,
+                    "title": article.get("title", ""),
+                    "description": article.get("description", ""),
+                    "url": article.get("url", ""),
+                    "publishedAt": article.get("published_at", ""),
+                    "source": article.get("source", {}).get("name", "Unknown"),
+                    "sentiment_label": sentiment_label,
+                    "sentiment_score": abs(sentiment),
+                    "polarity": sentiment,
+                    "text_length": len(full_text),
+                }
+            )
+        return news_data
+
+    @cached(endpoint="news_yahoo_rss", ttl=NEWS_CACHE_TTL)
     def get_news_data_yahoo_rss(self, ticker, limit=10):
         """Yahoo Finance RSS 뉴스 데이터 수집"""
         try:
-            import feedparser
-
             # Yahoo Finance RSS URL
             rss_url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
 
-            feed = feedparser.parse(rss_url)
-            news_data = []
-
-            for entry in feed.entries[:limit]:
-                # 감성 분석 (TextBlob 사용)
-                title = entry.title
-                summary = entry.summary if hasattr(entry, "summary") else ""
-                full_text = f"{title} {summary}"
-
-                blob = TextBlob(full_text)
-                sentiment = blob.sentiment.polarity
+            response = self.session.get(rss_url, timeout=HTTP_TIMEOUT)
+
+            # (제목, 요약, 링크) 목록
+            if etree is not None:
+                # item의 필요한 태그만 libxml2로 직접 읽음 (feedparser의 정규화/정제 생략)
+                root = etree.fromstring(response.content)
+                entries = [
+                    (
+                        item.findtext("title", ""),
+                        item.findtext("description", ""),
+                        item.findtext("link", ""),
+                    )
+                    for item in itertools.islice(root.iterfind(".//item"), limit)
+                ]
+            else:
+                import feedparser
+
+                feed = feedparser.parse(response.content)
+                entries = [
+                    (
+                        entry.title,
+                        entry.summary if hasattr(entry, "summary") else "",
+                        entry.link,
+                    )
+                    for entry in feed.entries[:limit]
+                ]
+            full_texts = [f"{title} {summary}" for title, summary, _ in entries]
 
-                # 감성 라벨 변환
-                if sentiment > 0.1:
-                    sentiment_label = "positive"
-                elif sentiment < -0.1:
-                    sentiment_label = "negative"
-                else:
-                    sentiment_label = "neutral"
+            # 감성 분석 (TextBlob 사용, 라벨은 전체 기사에 대해 한 번에 변환)
+            polarities, labels = _textblob_sentiment(full_texts)
 
+            news_data = []
+            for (title, summary, link), full_text, sentiment, sentiment_label in zip(
+                entries, full_texts, polarities, labels
+            ):
                 news_data.append(
                     {
                         "ticker": ticker,
                         "title": title,
                         "description": summary,
-                        "url": entry.link,
+                        "url": link,
                         "sentiment_label": sentiment_label,
                         "sentiment_score": abs(sentiment),
                         "polarity": sentiment,
@@ -155,40 +342,38 @@ class APIManager:
             self.logger.error(f"Yahoo RSS 뉴스 수집 실패: {e}")
             return []
 
+    @cached(endpoint="news_free_api", ttl=NEWS_CACHE_TTL)
     def get_news_data_free_api(self, ticker, limit=10):
         """무료 뉴스 API 사용"""
         try:
             # NewsData.io 무료 API (일일 200회 제한)
             url = f"https://newsdata.io/api/1/news?apikey=FREE&q={ticker}&language=en&category=business"
 
-            response = requests.get(url)
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
             data = response.json()
 
             if data.get("status") == "success":
-                news_data = []
-
-                for article in data.get("results", [])[:limit]:
-                    # 감성 분석
-                    title = article.get("title", "")
-                    description = article.get("description", "")
-                    full_text = f"{title} {description}"
-
-                    blob = TextBlob(full_text)
-                    sentiment = blob.sentiment.polarity
+                articles = data.get("results", [])[:limit]
+                full_texts = [
+                    f"{article.get('title', '')} {article.get('description', '')}"
+                    for article in articles
+                ]
+                # 감성 분석
+                polarities, labels = _textblob_sentiment(full_texts)
 
+                news_data = []
+                for article, full_text, sentiment, sentiment_label in zip(
+                    articles, full_texts, polarities, labels
+                ):
                     news_data.append(
                         {
                             "ticker": ticker,
-                            "title": title,
-                            "description": description,
+                            "title": article.get("title", ""),
+                            "description": article.get("description", ""),
                             "url": article.get("link", ""),
                             "publishedAt": article.get("pubDate", ""),
                             "source": article.get("source_id", "Unknown"),
-                            "sentiment_label": (
-                                "positive"
-                                if sentiment > 0.1
-                                else "negative" if sentiment < -0.1 else "neutral"
-                            ),
+                            "sentiment_label": sentiment_label,
                             "sentiment_score": abs(sentiment),
                             "polarity": sentiment,
                             "text_length": len(full_text),
@@ -202,11 +387,10 @@ class APIManager:
 
         return []
 
+    @cached(endpoint="news_web_scraping", ttl=NEWS_CACHE_TTL)
     def get_news_data_web_scraping(self, ticker, limit=5):
         """웹 스크래핑 백업 방법"""
         try:
-            from bs4 import BeautifulSoup
-
             # Google News 검색
             url = f"https://news.google.com/search?q={ticker}&hl=en-US&gl=US&ceid=US:en"
 
@@ -214,42 +398,50 @@ class APIManager:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
 
-            response = requests.get(url, headers=headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            news_data = []
-            articles = soup.find_all("article")[:limit]
-
-            for article in articles:
-                try:
-                    title_elem = article.find("h3")
-                    title = title_elem.get_text() if title_elem else "No title"
-
-                    # 감성 분석
-                    blob = TextBlob(title)
-                    sentiment = blob.sentiment.polarity
+            response = self.session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+
+            titles = []
+            if lxml_html is not None:
+                # libxml2 HTML 파서로 article의 첫 h3만 찾음 (경로는 lxml이 컴파일해 캐시)
+                doc = lxml_html.fromstring(response.content)
+                for article in itertools.islice(doc.iterfind(".//article"), limit):
+                    title_elem = article.find(".//h3")
+                    if title_elem is None:
+                        titles.append("No title")
+                    else:
+                        titles.append(title_elem.text_content())
+            else:
+                from bs4 import BeautifulSoup
+
+                soup = BeautifulSoup(response.content, "html.parser")
+                for article in soup.find_all("article")[:limit]:
+                    try:
+                        title_elem = article.find("h3")
+                        titles.append(
+                            title_elem.get_text() if title_elem else "No title"
+                        )
+                    except Exception:
+                        continue
 
-                    news_data.append(
-                        {
-                            "ticker": ticker,
-                            "title": title,
-                            "description": title,  # 제목만 사용
-                            "url": "",
-                            "publishedAt": datetime.now().isoformat(),
-                            "source": "Google News",
-                            "sentiment_label": (
-                                "positive"
-                                if sentiment > 0.1
-                                else "negative" if sentiment < -0.1 else "neutral"
-                            ),
-                            "sentiment_score": abs(sentiment),
-                            "polarity": sentiment,
-                            "text_length": len(title),
-                        }
-                    )
+            # 감성 분석
+            polarities, labels = _textblob_sentiment(titles)
 
-                except Exception:
-                    continue
+            news_data = []
+            for title, sentiment, sentiment_label in zip(titles, polarities, labels):
+                news_data.append(
+                    {
+                        "ticker": ticker,
+                        "title": title,
+                        "description": title,  # 제목만 사용
+                        "url": "",
+                        "publishedAt": datetime.now().isoformat(),
+                        "source": "Google News",
+                        "sentiment_label": sentiment_label,
+                        "sentiment_score": abs(sentiment),
+                        "polarity": sentiment,
+                        "text_length": len(title),
+                    }
+                )
 
             return news_data
 
@@ -257,6 +449,7 @@ class APIManager:
             self.logger.error(f"웹 스크래핑 실패: {e}")
             return []
 
+    @cached(endpoint="market_yfinance", ttl=_yfinance_cache_ttl)
     def get_market_data_yfinance(self, ticker, period="1d", interval="1m"):
         """YFinance를 통한 시장 데이터 수집"""
         try:
@@ -272,6 +465,46 @@ class APIManager:
             self.logger.error(f"YFinance 데이터 수집 실패: {e}")
             return None
 
+    @cached(endpoint="market_yfinance_batch", ttl=_yfinance_cache_ttl)
+    def get_market_data_yfinance_batch(self, tickers, period="1y", interval="1d"):
+        """
+        YFinance 다중 종목 시장 데이터 수집
+
+        yf.download 한 번으로 모든 종목을 받아 오며(내부 스레드 풀로 동시 요청),
+        데이터를 받은 종목만 {티커: DataFrame}으로 반환합니다.
+        """
+        try:
+            panel = yf.download(
+                list(tickers),
+                period=period,
+                interval=interval,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                auto_adjust=False,
+            )
+        except Exception as e:
+            self.logger.error(f"YFinance 다중 종목 데이터 수집 실패: {e}")
+            return {}
+
+        if panel is None or panel.empty:
+            return {}
+
+        data = {}
+        for ticker in tickers:
+            if isinstance(panel.columns, pd.MultiIndex):
+                if ticker not in panel.columns.get_level_values(0):
+                    continue
+                hist = panel[ticker]
+            else:  # 단일 종목이면 열이 종목별로 나뉘지 않음
+                hist = panel
+            # 다른 종목과 날짜를 맞추느라 생긴 빈 행 제거
+            hist = hist.dropna(how="all")
+            if not hist.empty:
+                data[ticker] = hist
+        return data
+
+    @cached(endpoint="market_alpha_vantage_free", ttl=INTRADAY_CACHE_TTL)
     def get_market_data_alpha_vantage_free(self, ticker):
         """Alpha Vantage 무료 API"""
         try:
@@ -279,7 +512,7 @@ class APIManager:
             api_key = "demo"  # 실제로는 회원가입 필요
             url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={ticker}&apikey={api_key}"
 
-            response = requests.get(url)
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
             data = response.json()
 
             if "Global Quote" in data:
@@ -323,6 +556,7 @@ class APIManager:
 
         return news_data
 
+    @cached(endpoint="market_polygon", ttl=_polygon_cache_ttl)
     def get_market_data_polygon(
         self, ticker, multiplier=1, timespan="day", from_date=None, to_date=None
     ):
@@ -341,7 +575,7 @@ class APIManager:
             self.logger.info(
                 f"Polygon.io API request URL for {ticker}: {url}"
             )  # Log Polygon.io URL
-            response = requests.get(url)
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
             if not response.ok:
                 self.logger.error(
                     f"Polygon.io API request failed with status {response.status_code}: {response.text}"
@@ -397,6 +631,7 @@ additional_requirements = """
 feedparser>=6.0.0
 beautifulsoup4>=4.11.0
 requests>=2.28.0
+lxml>=4.9.0  # 선택: RSS 파싱 가속
 """
 
 if __name__ == "__main__":
@@ -1,20 +1,76 @@
 import pandas as pd
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import io
 import os
 import numpy as np
-from textblob import TextBlob
 import ta
-from transformers import pipeline
+from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
 import logging
 
+try:
+    import torch
+except ImportError:  # torch 미설치 시 기본 장치(CPU) 사용
+    torch = None
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck 미설치 시 pandas rolling 사용
+    bn = None
+
 from tqdm import tqdm
-from src.core.api_config import APIManager
+from src.core.api_config import APIManager, HTTP_TIMEOUT, textblob_polarity
 
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# 금융 텍스트에 특화된 FinBERT 모델과 배치 추론 크기
+FINBERT_MODEL = "ProsusAI/finbert"
+FINBERT_BATCH_SIZE = 32
+# 종목별 API 요청을 동시에 보낼 최대 스레드 수
+MAX_FETCH_WORKERS = 8
+# 데이터셋 생성에 사용하는 주가 데이터 열
+STOCK_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def _day_keys(dates):
+    """
+    날짜 열을 1970-01-01 기준 일 수(int32)로 변환합니다.
+    (datetime.date 객체 대신 정수 키로 병합해 pandas의 정수 해시 조인 경로 사용)
+    """
+    days = dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    return days.view("int64").astype(np.int32)
+
+
+@functools.lru_cache(maxsize=None)
+def get_finbert_pipeline():
+    """
+    FinBERT 감성 분석 파이프라인을 반환합니다. (프로세스당 한 번만 로드)
+
+    GPU가 있으면 FP16으로 GPU에서, 없으면 Linear 가중치를 int8로 동적 양자화해
+    CPU에서 추론합니다.
+    """
+    if torch is None:
+        return pipeline("sentiment-analysis", model=FINBERT_MODEL)
+
+    if torch.cuda.is_available():
+        return pipeline(
+            "sentiment-analysis",
+            model=FINBERT_MODEL,
+            device=0,
+            torch_dtype=torch.float16,
+        )
+
+    model = AutoModelForSequenceClassification.from_pretrained(FINBERT_MODEL)
+    model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    tokenizer = AutoTokenizer.from_pretrained(FINBERT_MODEL)
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
 
 class SP500DataCollector:
     """
@@ -38,23 +94,28 @@ class SP500DataCollector:
         """
         self.data_dir = data_dir
         self.sp500_tickers = []
-        # 금융 텍스트에 특화된 FinBERT 모델 로드
-        self.sentiment_analyzer = pipeline(
-            "sentiment-analysis", model="ProsusAI/finbert"
-        )
         self.api_manager = APIManager()  # APIManager 인스턴스 생성
+        # HTTP 요청은 APIManager의 연결 풀 세션을 함께 사용
+        self.session = self.api_manager.session
 
         # 데이터 저장 디렉토리 생성
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
 
+    @property
+    def sentiment_analyzer(self):
+        """FinBERT 파이프라인 (뉴스 감성 분석에 처음 사용할 때 로드)"""
+        return get_finbert_pipeline()
+
     def get_sp500_tickers(self):
         """
         S&P500 구성 종목의 최신 티커 목록을 웹에서 가져와 CSV 파일로 저장합니다.
         """
         url = "https://datahub.io/core/s-and-p-500-companies/r/constituents.csv"
         try:
-            df = pd.read_csv(url)
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            df = pd.read_csv(io.BytesIO(response.content))
             self.sp500_tickers = df["Symbol"].tolist()
             df.to_csv(f"{self.data_dir}/sp500_constituents.csv", index=False)
             logging.info(f"S&P500 티커 {len(self.sp500_tickers)}개 수집 완료.")
@@ -103,50 +164,97 @@ class SP500DataCollector:
         # 테스트를 위해 일부 티커만 사용
         tickers_to_fetch = self.sp500_tickers[:num_tickers]
 
-        for ticker in tqdm(tickers_to_fetch, desc="Collecting stock data"):
-            hist = None
-            try:
-                # APIManager를 통해 시장 데이터 수집
-                hist = self.api_manager.get_market_data(ticker, period=period)
-                if hist is None or hist.empty:
-                    logging.warning(
-                        f"{ticker} 주가 데이터를 수집하지 못했습니다. 모의 데이터를 생성합니다."
-                    )
-                    hist = self._generate_mock_stock_data(ticker, period)
-            except Exception as e:
-                logging.error(
-                    f"{ticker} 주가 데이터 수집 실패: {e}. 모의 데이터를 생성합니다."
+        # 1차: yf.download 한 번으로 전체 종목의 일봉을 수집 (yfinance 내부 스레드 풀 사용)
+        histories = self.api_manager.get_market_data_yfinance_batch(
+            tickers_to_fetch, period=period, interval="1d"
+        )
+        for ticker, hist in histories.items():
+            self._save_stock_data(ticker, hist)
+
+        # 받지 못한 종목만 종목별 폴백 경로로 스레드를 통해 동시에 요청
+        missing = [ticker for ticker in tickers_to_fetch if ticker not in histories]
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            fallback = executor.map(
+                lambda ticker: self._fetch_stock_data(ticker, period), missing
+            )
+            for ticker, hist in tqdm(
+                zip(missing, fallback),
+                total=len(missing),
+                desc="Collecting stock data",
+            ):
+                self._save_stock_data(ticker, hist)
+
+    def _fetch_stock_data(self, ticker, period):
+        """
+        종목 하나의 주가 데이터를 수집합니다. 실패 시 모의 데이터를 반환합니다.
+        """
+        try:
+            # APIManager를 통해 시장 데이터 수집
+            hist = self.api_manager.get_market_data(ticker, period=period)
+            if hist is None or hist.empty:
+                logging.warning(
+                    f"{ticker} 주가 데이터를 수집하지 못했습니다. 모의 데이터를 생성합니다."
                 )
                 hist = self._generate_mock_stock_data(ticker, period)
+        except Exception as e:
+            logging.error(
+                f"{ticker} 주가 데이터 수집 실패: {e}. 모의 데이터를 생성합니다."
+            )
+            hist = self._generate_mock_stock_data(ticker, period)
+        return hist
 
-            if hist is not None and not hist.empty:
-                hist.to_csv(f"{self.data_dir}/stock_{ticker}.csv", index=False)
-                logging.info(
-                    f"Columns saved to CSV for {ticker}: {hist.columns.tolist()}"
-                )
-                logging.info(f"{ticker} 주가 데이터 저장 완료.")
-            else:
-                logging.error(f"모의 데이터 생성에도 실패했습니다: {ticker}")
+    def _save_stock_data(self, ticker, hist):
+        """
+        수집한 주가 데이터를 Parquet 파일로 저장합니다.
+        (열 단위 타입이 보존되어 데이터셋 생성 시 CSV 파싱이 필요 없음)
+        """
+        if hist is not None and not hist.empty:
+            if "Date" not in hist.columns:
+                # yfinance 결과는 날짜가 인덱스이므로 열로 변환
+                hist = hist.reset_index().rename(columns={"Datetime": "Date"})
+            hist.to_parquet(
+                f"{self.data_dir}/stock_{ticker}.parquet",
+                index=False,
+                compression="snappy",
+            )
+            logging.info(
+                f"Columns saved to Parquet for {ticker}: {hist.columns.tolist()}"
+            )
+            logging.info(f"{ticker} 주가 데이터 저장 완료.")
+        else:
+            logging.error(f"모의 데이터 생성에도 실패했습니다: {ticker}")
 
     def calculate_technical_indicators(self, df):
         """
         주가 데이터프레임에 다양한 기술적 지표를 계산하여 추가합니다.
         """
-        df_ti = df.copy()
-        # 이동평균, RSI, MACD 등 기본 지표 추가
-        df_ti["sma_20"] = ta.trend.sma_indicator(df_ti["Close"], window=20)
-        df_ti["sma_50"] = ta.trend.sma_indicator(df_ti["Close"], window=50)
-        df_ti["rsi"] = ta.momentum.rsi(df_ti["Close"], window=14)
-        df_ti["macd"] = ta.trend.macd_diff(df_ti["Close"])
-        # 볼린저 밴드
-        df_ti["bb_upper"] = ta.volatility.bollinger_hband(df_ti["Close"])
-        df_ti["bb_lower"] = ta.volatility.bollinger_lband(df_ti["Close"])
-        # 변동성 및 거래량 관련 지표
-        df_ti["atr"] = ta.volatility.average_true_range(
-            df_ti["High"], df_ti["Low"], df_ti["Close"]
+        close = df["Close"]
+        values = close.to_numpy(dtype=np.float64)
+
+        # 20일 이동평균/표준편차는 한 번만 계산해 SMA, 볼린저 밴드, 변동성에 함께 사용
+        # (표준편차는 볼린저 밴드와 같은 ddof=0, 변동성은 ddof=1로 환산)
+        if bn is not None and len(values) >= 50:
+            sma_20 = bn.move_mean(values, 20)
+            sma_50 = bn.move_mean(values, 50)
+            std_20 = bn.move_std(values, 20)
+        else:
+            rolling_20 = close.rolling(window=20)
+            sma_20 = rolling_20.mean().to_numpy()
+            sma_50 = close.rolling(window=50).mean().to_numpy()
+            std_20 = rolling_20.std(ddof=0).to_numpy()
+
+        # 이동평균, RSI, MACD 등 기본 지표와 볼린저 밴드, 변동성 및 거래량 관련 지표
+        df_ti = df.assign(
+            sma_20=sma_20,
+            sma_50=sma_50,
+            rsi=ta.momentum.rsi(close, window=14),
+            macd=ta.trend.macd_diff(close),
+            bb_upper=sma_20 + 2 * std_20,
+            bb_lower=sma_20 - 2 * std_20,
+            atr=ta.volatility.average_true_range(df["High"], df["Low"], close),
+            volatility=std_20 * np.sqrt(20 / 19),
+            obv=ta.volume.on_balance_volume(close, df["Volume"]),
         )
-        df_ti["volatility"] = df_ti["Close"].rolling(window=20).std()
-        df_ti["obv"] = ta.volume.on_balance_volume(df_ti["Close"], df_ti["Volume"])
 
         return df_ti
 
@@ -156,24 +264,37 @@ class SP500DataCollector:
         API 호출 실패 시 모의 뉴스 데이터를 사용합니다.
         """
         all_news = []
+        texts = []  # FinBERT 입력 (all_news와 같은 순서)
         tickers_to_fetch = self.sp500_tickers[:num_tickers]
 
-        for ticker in tqdm(tickers_to_fetch, desc="Collecting news data"):
-            articles = []
-            try:
-                # APIManager를 통해 뉴스 데이터 수집
-                articles = self.api_manager.get_news_data(ticker)
-                if not articles:  # If API returns empty or fails
-                    logging.warning(
-                        f"{ticker} 뉴스 데이터를 수집하지 못했습니다. 모의 뉴스 데이터를 생성합니다."
-                    )
-                    articles = self._generate_mock_news_data(ticker)
-            except Exception as e:
-                logging.error(
-                    f"{ticker} 뉴스 처리 중 오류: {e}. 모의 뉴스 데이터를 생성합니다."
-                )
-                articles = self._generate_mock_news_data(ticker)
-
+        # 1차: 여러 종목을 묶어 요청 한 번으로 수집 (종목 수만큼 요청하지 않음)
+        try:
+            news_by_ticker = self.api_manager.get_news_data_marketaux_batch(
+                tickers_to_fetch
+            )
+        except Exception as e:
+            logging.error(f"다중 종목 뉴스 수집 실패: {e}")
+            news_by_ticker = {}
+
+        # 기사를 받지 못한 종목만 종목별 폴백 경로로 스레드를 통해 동시에 요청
+        missing = [
+            ticker for ticker in tickers_to_fetch if not news_by_ticker.get(ticker)
+        ]
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            for ticker, articles in zip(
+                missing,
+                tqdm(
+                    executor.map(self._fetch_news, missing),
+                    total=len(missing),
+                    desc="Collecting news data",
+                ),
+            ):
+                news_by_ticker[ticker] = articles
+
+        # 분석은 종목 순서대로 수행
+        fetched = [news_by_ticker[ticker] for ticker in tickers_to_fetch]
+
+        for ticker, articles in zip(tickers_to_fetch, fetched):
             for article in articles:
                 title = article.get("title", "")
                 description = article.get("description", "")
@@ -181,10 +302,8 @@ class SP500DataCollector:
                 if not full_text.strip() or full_text == ". ":  # ". "인 경우도 필터링
                     continue
 
-                # FinBERT 분석
-                finbert_sentiment = self.sentiment_analyzer(full_text[:512])[0]
-                # TextBlob 분석
-                blob = TextBlob(full_text)
+                # FinBERT 입력은 모아 두었다가 모든 기사를 수집한 뒤 배치로 분석
+                texts.append(full_text[:512])
 
                 all_news.append(
                     {
@@ -198,16 +317,55 @@ class SP500DataCollector:
                             else None
                         ),
                         "title": title,
-                        "finbert_label": finbert_sentiment["label"],
-                        "finbert_score": finbert_sentiment["score"],
-                        "textblob_polarity": blob.sentiment.polarity,
+                        "finbert_label": None,
+                        "finbert_score": None,
+                        "textblob_polarity": textblob_polarity(full_text),
                     }
                 )
             logging.info(f"{ticker} 뉴스 {len(articles)}개 수집 및 분석 완료.")
 
+        # FinBERT 분석: 기사마다 호출하지 않고 전체 기사를 배치 단위로 한 번에 추론
+        # (여러 종목에 같은 기사가 실리는 경우가 많으므로 중복 텍스트는 한 번만 추론)
+        if texts:
+            unique_texts = list(dict.fromkeys(texts))
+            finbert_by_text = dict(
+                zip(
+                    unique_texts,
+                    self.sentiment_analyzer(
+                        unique_texts,
+                        batch_size=FINBERT_BATCH_SIZE,
+                        truncation=True,
+                        max_length=512,
+                    ),
+                )
+            )
+            for news, text in zip(all_news, texts):
+                finbert_sentiment = finbert_by_text[text]
+                news["finbert_label"] = finbert_sentiment["label"]
+                news["finbert_score"] = finbert_sentiment["score"]
+
         news_df = pd.DataFrame(all_news)
         news_df.to_csv(f"{self.data_dir}/news_sentiment_data.csv", index=False)
 
+    def _fetch_news(self, ticker):
+        """
+        종목 하나의 뉴스 기사를 수집합니다. 실패 시 모의 뉴스 데이터를 반환합니다.
+        """
+        try:
+            # APIManager를 통해 뉴스 데이터 수집
+            articles = self.api_manager.get_news_data(ticker)
+            if not articles:  # If API returns empty or fails
+                logging.warning(
+                    f"{ticker} 뉴스 데이터를 수집하지 못했습니다. 모의 뉴스 데이터를 생성합니다."
+                )
+                articles = self._generate_mock_news_data(ticker)
+        except Exception as e:
+            logging.error(
+                f"{ticker} 뉴스 처리 중 오류: {e}. 모의 뉴스 데이터를 생성합니다."
+            )
+            articles = self._generate_mock_news_data(ticker)
+        return articles
+
     def _generate_mock_news_data(self, ticker, num_articles=5):
         """
         API 호출 실패 시 사용할 모의 뉴스 데이터를 생성합니다.
@@ -229,20 +387,21 @@ class SP500DataCollector:
         수집된 모든 데이터를 통합하고 가공하여 최종 훈련용 데이터셋을 생성합니다.
         이 과정에는 기술적 지표 추가, 뉴스 감성 데이터 병합, 이벤트 라벨링이 포함됩니다.
         """
-        all_features = []
-        all_labels = []
+        all_frames = []
 
         tickers_to_process = self.sp500_tickers[:num_tickers]
 
         # 뉴스 데이터 로드
         try:
             news_df = pd.read_csv(f"{self.data_dir}/news_sentiment_data.csv")
-            news_df["publishedAt"] = pd.to_datetime(news_df["publishedAt"]).dt.date
+            news_df["publishedAt"] = _day_keys(
+                pd.to_datetime(news_df["publishedAt"], utc=True).dt.tz_localize(None)
+            )
         except FileNotFoundError:
             news_df = pd.DataFrame()
 
         for ticker in tqdm(tickers_to_process):
-            stock_file_path = f"{self.data_dir}/stock_{ticker}.csv"
+            stock_file_path = f"{self.data_dir}/stock_{ticker}.parquet"
             if not os.path.exists(stock_file_path):
                 logging.warning(
                     f"{ticker}의 주가 데이터 파일을 찾을 수 없습니다. 이 티커는 건너뜁니다."
@@ -251,9 +410,10 @@ class SP500DataCollector:
 
             try:
                 # 주가 데이터 로드 및 기술적 지표 계산
-                stock_df = pd.read_csv(stock_file_path, parse_dates=["Date"])
+                # 필요한 열만 타입이 지정된 상태로 읽음
+                stock_df = pd.read_parquet(stock_file_path, columns=STOCK_COLUMNS)
                 logging.info(
-                    f"Columns read from CSV for {ticker}: {stock_df.columns.tolist()}"
+                    f"Columns read from Parquet for {ticker}: {list(stock_df.columns)}"
                 )
 
                 if stock_df.empty:
@@ -266,7 +426,7 @@ class SP500DataCollector:
                     stock_df["Date"], utc=True
                 ).dt.tz_localize(None)
                 stock_df_ti = self.calculate_technical_indicators(stock_df)
-                stock_df_ti["date_key"] = stock_df_ti["Date"].dt.date
+                stock_df_ti["date_key"] = _day_keys(stock_df_ti["Date"])
 
                 # 뉴스 데이터와 병합
                 if not news_df.empty:
@@ -287,84 +447,83 @@ class SP500DataCollector:
                         stock_df_ti, daily_sentiment, on="date_key", how="left"
                     )
 
-                # 이벤트 라벨 생성
-                stock_df_ti["price_change"] = stock_df_ti["Close"].pct_change()
-                stock_df_ti["volume_change"] = stock_df_ti["Volume"].pct_change()
-                stock_df_ti["unusual_volume"] = (
-                    stock_df_ti["Volume"]
-                    > stock_df_ti["Volume"].rolling(window=20).mean() * 2
-                ).astype(int)
-                stock_df_ti["price_spike"] = (
-                    abs(stock_df_ti["price_change"]) > 0.05
-                ).astype(int)
-
-                # 주요 이벤트 정의: 가격 스파이크 또는 이례적 거래량 발생 시
-                stock_df_ti["major_event"] = (
-                    (stock_df_ti["price_spike"] == 1)
-                    | (stock_df_ti["unusual_volume"] == 1)
-                ).astype(int)
-
-                # 데이터 정리
-                stock_df_ti.fillna(0, inplace=True)
                 stock_df_ti["ticker"] = ticker
-
-                # 특성과 라벨 분리
-                feature_cols = [
-                    "ticker",
-                    "Date",
-                    "Open",
-                    "High",
-                    "Low",
-                    "Close",
-                    "Volume",
-                    "sma_20",
-                    "sma_50",
-                    "rsi",
-                    "macd",
-                    "bb_upper",
-                    "bb_lower",
-                    "atr",
-                    "volatility",
-                    "obv",
-                    "price_change",
-                    "volume_change",
-                    "unusual_volume",
-                    "price_spike",
-                    "news_sentiment",
-                    "news_polarity",
-                    "news_count",
-                ]
-                label_cols = [
-                    "ticker",
-                    "Date",
-                    "major_event",
-                    "price_spike",
-                    "unusual_volume",
-                ]
-
-                # news 관련 컬럼이 없는 경우를 대비
-                for col in ["news_sentiment", "news_polarity", "news_count"]:
-                    if col not in stock_df_ti:
-                        stock_df_ti[col] = 0
-
-                all_features.append(stock_df_ti[feature_cols])
-                all_labels.append(stock_df_ti[label_cols])
+                all_frames.append(stock_df_ti)
 
             except Exception as e:
                 logging.error(f"{ticker} 데이터셋 생성 중 오류: {e}")
 
-        # 최종 데이터프레임 생성 및 저장
-        if all_features:
-            features_df = pd.concat(all_features, ignore_index=True)
-            labels_df = pd.concat(all_labels, ignore_index=True)
-
-            features_df.to_csv(f"{self.data_dir}/training_features.csv", index=False)
-            labels_df.to_csv(f"{self.data_dir}/event_labels.csv", index=False)
-            logging.info("최종 훈련용 특성 및 라벨 파일 생성 완료.")
-        else:
+        if not all_frames:
             logging.warning(
                 "수집된 데이터가 없어 훈련용 특성 및 라벨 파일을 생성하지 않습니다."
             )
+            return
+
+        # 이벤트 라벨 생성: 전체 종목을 이어 붙인 뒤 종목별 groupby 한 번으로 계산
+        big_df = pd.concat(all_frames, ignore_index=True)
+        by_ticker = big_df.groupby("ticker", sort=False)
+        big_df["price_change"] = by_ticker["Close"].pct_change()
+        big_df["volume_change"] = by_ticker["Volume"].pct_change()
+        volume_ma = by_ticker["Volume"].rolling(window=20).mean().droplevel(0)
+        big_df["unusual_volume"] = (big_df["Volume"] > volume_ma * 2).astype("int8")
+        big_df["price_spike"] = (big_df["price_change"].abs() > 0.05).astype("int8")
+
+        # 주요 이벤트 정의: 가격 스파이크 또는 이례적 거래량 발생 시
+        big_df["major_event"] = (
+            (big_df["price_spike"] == 1) | (big_df["unusual_volume"] == 1)
+        ).astype("int8")
+
+        # 데이터 정리: 결측은 숫자 열에만 채움 (ticker 등 object 열은 검사하지 않음)
+        num_cols = big_df.select_dtypes("number").columns
+        big_df[num_cols] = big_df[num_cols].fillna(0)
+
+        # news 관련 컬럼이 없는 경우를 대비
+        for col in ["news_sentiment", "news_polarity", "news_count"]:
+            if col not in big_df:
+                big_df[col] = 0
+        big_df["news_count"] = big_df["news_count"].astype("int16")
+
+        # 특성과 라벨 분리
+        feature_cols = [
+            "ticker",
+            "Date",
+            "Open",
+            "High",
+            "Low",
+            "Close",
+            "Volume",
+            "sma_20",
+            "sma_50",
+            "rsi",
+            "macd",
+            "bb_upper",
+            "bb_lower",
+            "atr",
+            "volatility",
+            "obv",
+            "price_change",
+            "volume_change",
+            "unusual_volume",
+            "price_spike",
+            "news_sentiment",
+            "news_polarity",
+            "news_count",
+        ]
+        label_cols = [
+            "ticker",
+            "Date",
+            "major_event",
+            "price_spike",
+            "unusual_volume",
+        ]
+
+        # 최종 데이터프레임 생성 및 저장
+        features_df = big_df[feature_cols]
+        labels_df = big_df[label_cols]
+
+        features_df.to_csv(f"{self.data_dir}/training_features.csv", index=False)
+        labels_df.to_csv(f"{self.data_dir}/event_labels.csv", index=False)
+        logging.info("최종 훈련용 특성 및 라벨 파일 생성 완료.")
 
 
 if __name__ == "__main__":
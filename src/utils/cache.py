@@ -0,0 +1,109 @@
+"""
+API 응답 파일 캐시
+같은 엔드포인트와 인자로 들어온 요청의 응답을 TTL 동안 디스크에 저장해 재사용
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+
+class FileCache:
+    """
+    (엔드포인트, 인자) 해시를 키로 응답을 파일에 저장하는 TTL 캐시.
+
+    응답에는 뉴스 목록(dict 리스트)과 주가 DataFrame이 모두 있으므로
+    {"ts": 저장 시각, "payload": 응답}을 pickle로 저장합니다.
+    """
+
+    def __init__(self, cache_dir=".cache", ttl_days=1):
+        """
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리 경로.
+            ttl_days (float): get 호출 시 ttl을 지정하지 않았을 때의 유효 기간(일).
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl_days * 24 * 60 * 60
+
+    @staticmethod
+    def make_key(endpoint, *args, **kwargs):
+        """엔드포인트와 호출 인자로 캐시 키 생성"""
+        raw = f"{endpoint}|{args!r}|{sorted(kwargs.items())!r}"
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key, ttl=None):
+        """유효 기간 내의 응답을 반환 (없거나 만료되었으면 None)"""
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if time.time() - entry["ts"] >= (self.ttl if ttl is None else ttl):
+            return None
+        return entry["payload"]
+
+    def set(self, key, payload):
+        """응답 저장 (임시 파일에 쓴 뒤 교체해 동시 읽기에도 깨진 파일이 보이지 않음)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"ts": time.time(), "payload": payload},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _is_empty(payload):
+    if payload is None:
+        return True
+    empty = getattr(payload, "empty", None)  # DataFrame
+    return empty if empty is not None else len(payload) == 0
+
+
+def cached(endpoint, ttl):
+    """
+    인스턴스의 `cache` (FileCache) 속성을 사용하는 메서드 캐시 데코레이터.
+
+    Args:
+        endpoint (str): 캐시 키에 포함할 엔드포인트 이름.
+        ttl (int | callable): 유효 기간(초). 호출 인자에 따라 달라지면
+            메서드와 같은 인자를 받아 초를 반환하는 함수.
+
+    실패(None)나 빈 응답은 저장하지 않아 다음 호출에서 다시 요청합니다.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, "cache", None)
+            if cache is None:
+                return method(self, *args, **kwargs)
+
+            key = FileCache.make_key(endpoint, *args, **kwargs)
+            max_age = ttl(*args, **kwargs) if callable(ttl) else ttl
+            payload = cache.get(key, max_age)
+            if payload is not None:
+                return payload
+
+            payload = method(self, *args, **kwargs)
+            if not _is_empty(payload):
+                cache.set(key, payload)
+            return payload
+
+        return wrapper
+
+    return decorator